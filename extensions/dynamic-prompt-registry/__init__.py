@@ -16,7 +16,7 @@ CLI:
 """
 
 from .registry import PromptRegistry, Prompt, Domain, create_default_registry
-from .selector import select_prompt, classify_domain, explain_selection
+from .selector import select_prompt, classify_domain, classify_batch, explain_selection
 
 __all__ = [
     "PromptRegistry",
@@ -25,6 +25,7 @@ __all__ = [
     "create_default_registry",
     "select_prompt",
     "classify_domain",
+    "classify_batch",
     "explain_selection",
 ]
 
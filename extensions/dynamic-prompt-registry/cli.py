@@ -12,6 +12,7 @@ Usage:
 import sys
 import os
 import argparse
+from functools import lru_cache
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(__file__))
@@ -20,9 +21,18 @@ from registry import PromptRegistry, Domain, create_default_registry
 from selector import select_prompt, explain_selection
 
 
+@lru_cache(maxsize=None)
+def default_registry() -> PromptRegistry:
+    """Default registry, built once and shared by every command in this process.
+
+    Commands only read from it; do not register into the returned registry.
+    """
+    return create_default_registry()
+
+
 def cmd_list(args):
     """List all prompts."""
-    r = create_default_registry()
+    r = default_registry()
 
     if args.domain:
         try:
@@ -52,7 +62,7 @@ def cmd_list(args):
 
 def cmd_get(args):
     """Get a specific prompt."""
-    r = create_default_registry()
+    r = default_registry()
     prompt = r.get(args.name)
 
     if not prompt:
@@ -71,7 +81,7 @@ def cmd_get(args):
 
 def cmd_select(args):
     """Select best prompt for a problem."""
-    r = create_default_registry()
+    r = default_registry()
 
     if args.explain:
         print(explain_selection(args.problem, r))
@@ -89,7 +99,7 @@ def cmd_select(args):
 
 def cmd_render(args):
     """Render a prompt with variables."""
-    r = create_default_registry()
+    r = default_registry()
     prompt = r.get(args.name)
 
     if not prompt:
@@ -109,7 +119,8 @@ def cmd_render(args):
     return 0
 
 
-def main():
+def build_parser():
+    """Build the argument parser for all subcommands."""
     parser = argparse.ArgumentParser(
         description="Prompt Registry CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -144,7 +155,13 @@ Examples:
     render_parser.add_argument("name", help="Prompt name")
     render_parser.add_argument("vars", nargs="*", help="Variables as --key=value")
 
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv=None):
+    """Run the CLI; argv defaults to sys.argv[1:]. Returns the exit code."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
 
     if args.command == "list":
         return cmd_list(args)
@@ -9,6 +9,12 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from enum import Enum, auto
 import json
+import re
+
+
+# Matches {name} placeholders; braces whose contents are not a passed
+# variable (JSON examples, unknown names) are left untouched
+PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
 
 
 class Domain(Enum):
@@ -32,11 +38,15 @@ class Prompt:
     tags: List[str] = field(default_factory=list)
 
     def render(self, **kwargs) -> str:
-        """Render template with variables."""
-        result = self.template
-        for key, value in kwargs.items():
-            result = result.replace(f"{{{key}}}", str(value))
-        return result
+        """Render template with variables in a single pass.
+
+        Unknown placeholders are left as-is, e.g. "{age}".
+        """
+        def substitute(match):
+            key = match.group(1)
+            return str(kwargs[key]) if key in kwargs else match.group(0)
+
+        return PLACEHOLDER.sub(substitute, self.template)
 
 
 class PromptRegistry:
@@ -51,6 +61,9 @@ class PromptRegistry:
 
     def __init__(self):
         self.prompts: Dict[str, Prompt] = {}
+        # Secondary indices, keyed by prompt name so re-registering replaces in place
+        self._by_domain: Dict[Domain, Dict[str, Prompt]] = {}
+        self._by_tag: Dict[str, Dict[str, Prompt]] = {}
 
     def register(
         self,
@@ -68,9 +81,46 @@ class PromptRegistry:
             quality=quality,
             tags=tags or []
         )
+        old = self.prompts.get(name)
         self.prompts[name] = prompt
+        if old is None:
+            # New names go last, as in self.prompts
+            self._by_domain.setdefault(domain, {})[name] = prompt
+            for tag in prompt.tags:
+                self._by_tag.setdefault(tag, {})[name] = prompt
+        else:
+            self._reindex(old, prompt)
         return prompt
 
+    def _reindex(self, old: Prompt, new: Prompt):
+        """
+        Replace old with new (same name) in the secondary indices.
+
+        Buckets keep self.prompts order, where a re-registered name keeps
+        its original position: a bucket the prompt stays in is updated in
+        place, and one it joins is rebuilt in registry order.
+        """
+        name = new.name
+        if new.domain == old.domain:
+            self._by_domain[new.domain][name] = new
+        else:
+            self._by_domain[old.domain].pop(name, None)
+            self._by_domain[new.domain] = {
+                n: p for n, p in self.prompts.items() if p.domain == new.domain
+            }
+
+        new_tags = set(new.tags)
+        for tag in set(old.tags) - new_tags:
+            self._by_tag[tag].pop(name, None)
+        for tag in new_tags:
+            bucket = self._by_tag.get(tag)
+            if bucket is not None and name in bucket:
+                bucket[name] = new
+            else:
+                self._by_tag[tag] = {
+                    n: p for n, p in self.prompts.items() if tag in p.tags
+                }
+
     def get(self, name: str) -> Optional[Prompt]:
         """Get a prompt by name."""
         return self.prompts.get(name)
@@ -81,11 +131,11 @@ class PromptRegistry:
 
     def find_by_domain(self, domain: Domain) -> List[Prompt]:
         """Find prompts by domain."""
-        return [p for p in self.prompts.values() if p.domain == domain]
+        return list(self._by_domain.get(domain, {}).values())
 
     def find_by_tag(self, tag: str) -> List[Prompt]:
         """Find prompts by tag."""
-        return [p for p in self.prompts.values() if tag in p.tags]
+        return list(self._by_tag.get(tag, {}).values())
 
     def find_by_quality(self, min_quality: float) -> List[Prompt]:
         """Find prompts meeting quality threshold."""
@@ -93,10 +143,10 @@ class PromptRegistry:
 
     def best_for_domain(self, domain: Domain) -> Optional[Prompt]:
         """Get highest quality prompt for a domain."""
-        domain_prompts = self.find_by_domain(domain)
+        domain_prompts = self._by_domain.get(domain)
         if not domain_prompts:
             return None
-        return max(domain_prompts, key=lambda p: p.quality)
+        return max(domain_prompts.values(), key=lambda p: p.quality)
 
     def to_dict(self) -> Dict[str, Any]:
         """Export to dict."""
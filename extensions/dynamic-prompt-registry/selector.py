@@ -41,6 +41,20 @@ def classify_domain(text: str) -> Tuple[Domain, int]:
     return best_domain, best_count
 
 
+def classify_batch(texts: List[str]) -> List[Tuple[Domain, int]]:
+    """
+    Classify many texts at once.
+
+    Same result as calling classify_domain on each text; identical
+    texts in the batch are only classified once.
+    """
+    results = {}
+    for text in texts:
+        if text not in results:
+            results[text] = classify_domain(text)
+    return [results[text] for text in texts]
+
+
 def select_prompt(
     problem: str,
     registry: PromptRegistry,
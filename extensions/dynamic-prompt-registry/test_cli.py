@@ -5,37 +5,52 @@ CLI Integration Tests - Tests the command-line interface
 Run with: python3 test_cli.py
 """
 
-import subprocess
+import io
 import sys
 import os
+from contextlib import redirect_stdout, redirect_stderr
 
-CLI_PATH = os.path.join(os.path.dirname(__file__), "cli.py")
+sys.path.insert(0, os.path.dirname(__file__))
+
+import cli
 
 
 def run_cli(*args):
-    """Run CLI with arguments and return output."""
-    result = subprocess.run(
-        [sys.executable, CLI_PATH] + list(args),
-        capture_output=True,
-        text=True
-    )
-    return result.returncode, result.stdout, result.stderr
+    """Run CLI in-process with arguments and return (code, stdout, stderr)."""
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        try:
+            code = cli.main(list(args))
+        except SystemExit as e:  # argparse exits on --help and usage errors
+            code = e.code if isinstance(e.code, int) else 1
+    return code, out.getvalue(), err.getvalue()
 
 
 def header(text):
-    print(f"\n{'='*60}")
-    print(f"  {text}")
-    print(f"{'='*60}\n")
+    rule = '=' * 60
+    print(f"\n{rule}\n  {text}\n{rule}\n")
 
 
 def test_result(name, passed, output=""):
     status = "✅ PASS" if passed else "❌ FAIL"
-    print(f"  {status}: {name}")
+    line = f"  {status}: {name}"
     if output and not passed:
-        print(f"         Output: {output[:200]}")
+        line += f"\n         Output: {output[:200]}"
+    print(line)
     return passed
 
 
+def run_buffered(test_fn):
+    """Run a test group with its output buffered, then emit it in one write."""
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            return test_fn()
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+
 def test_cli_list():
     """Test 'list' command."""
     header("CLI TEST 1: list command")
@@ -63,7 +78,7 @@ def test_cli_list():
 
     print(f"\n  Output preview:\n{out[:300]}...")
 
-    return all([t1, t2, t3])
+    return t1 and t2 and t3
 
 
 def test_cli_list_domain():
@@ -93,7 +108,7 @@ def test_cli_list_domain():
 
     print(f"\n  Output:\n{out}")
 
-    return all([t1, t2, t3])
+    return t1 and t2 and t3
 
 
 def test_cli_get():
@@ -127,7 +142,7 @@ def test_cli_get():
         out2
     )
 
-    return all([t1, t2, t3])
+    return t1 and t2 and t3
 
 
 def test_cli_select():
@@ -163,7 +178,7 @@ def test_cli_select():
 
     print(f"\n  Explain output:\n{out2}")
 
-    return all([t1, t2, t3])
+    return t1 and t2 and t3
 
 
 def test_cli_render():
@@ -193,7 +208,7 @@ def test_cli_render():
 
     print(f"\n  Output:\n{out}")
 
-    return all([t1, t2, t3])
+    return t1 and t2 and t3
 
 
 def test_cli_help():
@@ -217,15 +232,14 @@ def test_cli_help():
 
     print(f"\n  Output preview:\n{out[:400]}...")
 
-    return all([t1, t2])
+    return t1 and t2
 
 
 def main():
     """Run all CLI tests."""
     header("CLI INTEGRATION TEST SUITE")
 
-    print("Testing the command-line interface end-to-end.")
-    print(f"CLI path: {CLI_PATH}\n")
+    print("Testing the command-line interface end-to-end.\n")
 
     tests = [
         ("list command", test_cli_list),
@@ -239,7 +253,7 @@ def main():
     results = []
     for name, test_fn in tests:
         try:
-            passed = test_fn()
+            passed = run_buffered(test_fn)
             results.append((name, passed, None))
         except Exception as e:
             results.append((name, False, str(e)))
@@ -5,30 +5,59 @@ Visible Test Suite - Shows what's being tested and results
 Run with: python3 test_visible.py
 """
 
+import io
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from registry import PromptRegistry, Domain, Prompt, create_default_registry
-from selector import select_prompt, classify_domain, explain_selection, DOMAIN_KEYWORDS
+from selector import select_prompt, classify_domain, classify_batch, explain_selection, DOMAIN_KEYWORDS
 
 
 def header(text):
-    print(f"\n{'='*60}")
-    print(f"  {text}")
-    print(f"{'='*60}\n")
+    rule = '=' * 60
+    print(f"\n{rule}\n  {text}\n{rule}\n")
 
 
 def test_result(name, passed, details=""):
     status = "✅ PASS" if passed else "❌ FAIL"
-    print(f"  {status}: {name}")
+    line = f"  {status}: {name}"
     if details:
-        print(f"         {details}")
+        line += f"\n         {details}"
+    print(line)
     return passed
 
 
+class ThreadLocalStdout(io.TextIOBase):
+    """stdout proxy that sends each thread's writes to its own buffer."""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def write(self, text):
+        buf = getattr(self._local, "buf", None)
+        return (buf if buf is not None else self._fallback).write(text)
+
+    def flush(self):
+        self._fallback.flush()
+
+    def capture(self, test_fn):
+        """Run test_fn on this thread, returning (passed, output, error)."""
+        self._local.buf = io.StringIO()
+        try:
+            return test_fn(), self._local.buf.getvalue(), None
+        except Exception as e:
+            return False, self._local.buf.getvalue(), str(e)
+        finally:
+            self._local.buf = None
+
+
 def test_registry_basics():
     """Test basic registry operations."""
     header("TEST 1: Registry Basics")
@@ -78,7 +107,7 @@ def test_registry_basics():
         f"result = {missing}"
     )
 
-    return all([t1, t2, t3, t4, t5])
+    return t1 and t2 and t3 and t4 and t5
 
 
 def test_domain_filtering():
@@ -130,7 +159,29 @@ def test_domain_filtering():
         f"result = {empty}"
     )
 
-    return all([t1, t2, t3, t4])
+    print("\nRe-registering sec2 under ALGORITHM...")
+    r.register("sec2", "Security 2", domain=Domain.ALGORITHM, quality=0.9)
+    security = r.find_by_domain(Domain.SECURITY)
+    best = r.best_for_domain(Domain.SECURITY)
+
+    t5 = test_result(
+        "Re-register moves prompt between domains",
+        [p.name for p in security] == ["sec1"] and best.name == "sec1",
+        f"found: {[p.name for p in security]}, best = {best.name if best else 'None'}"
+    )
+
+    print("\nRe-registering sec2 (back to SECURITY), then sec1 (same domain)...")
+    r.register("sec2", "Security 2", domain=Domain.SECURITY, quality=0.9)
+    r.register("sec1", "Security 1 v2", domain=Domain.SECURITY, quality=0.6)
+    security = [p.name for p in r.find_by_domain(Domain.SECURITY)]
+
+    t6 = test_result(
+        "Re-registered prompts keep their registration order",
+        security == ["sec1", "sec2"],
+        f"found: {security}"
+    )
+
+    return t1 and t2 and t3 and t4 and t5 and t6
 
 
 def test_selector_classification():
@@ -159,6 +210,14 @@ def test_selector_classification():
         test_result(f"Classified as {expected_domain.name}", passed)
         print()
 
+    texts = [text for text, _, _ in test_cases]
+    batch = classify_batch(texts + texts[:2])
+    results.append(test_result(
+        "classify_batch() matches per-text classify_domain()",
+        batch == [classify_domain(t) for t in texts + texts[:2]],
+        f"domains = {[d.name for d, _ in batch]}"
+    ))
+
     return all(results)
 
 
@@ -290,7 +349,7 @@ def test_tags():
         f"found: {[p.name for p in none]}"
     )
 
-    return all([t1, t2])
+    return t1 and t2
 
 
 def test_contains():
@@ -312,7 +371,7 @@ def test_contains():
         f"'missing' in r = {'missing' in r}"
     )
 
-    return all([t1, t2])
+    return t1 and t2
 
 
 def main():
@@ -332,13 +391,18 @@ def main():
         ("Contains Operator", test_contains),
     ]
 
+    # Groups share no state (each builds its own registry), so run them
+    # concurrently and replay their buffered output in declaration order.
+    stdout = ThreadLocalStdout(sys.stdout)
+    with redirect_stdout(stdout), ThreadPoolExecutor(max_workers=len(tests)) as pool:
+        futures = [pool.submit(stdout.capture, test_fn) for _, test_fn in tests]
+
     results = []
-    for name, test_fn in tests:
-        try:
-            passed = test_fn()
-            results.append((name, passed, None))
-        except Exception as e:
-            results.append((name, False, str(e)))
+    for (name, _), future in zip(tests, futures):
+        passed, output, error = future.result()
+        sys.stdout.write(output)
+        results.append((name, passed, error))
+    sys.stdout.flush()
 
     # Summary
     header("TEST SUMMARY")
@@ -23,22 +23,56 @@ References:
 __version__ = "2.0.0-alpha"
 __author__ = "Categorical Meta-Prompting Framework Contributors"
 
-from .categorical import (
-    Functor,
-    Monad,
-    MonadPrompt,
-    Comonad,
-    Observation,
-    CategoricalMetaPromptingEngine,
-    CategoricalExecutionResult,
-    create_categorical_engine,
-)
-
-from .monitoring import (
-    QualityMonitor,
-    QualityMetrics,
-    create_quality_monitor,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .categorical import (
+        Functor,
+        Monad,
+        MonadPrompt,
+        Comonad,
+        Observation,
+        CategoricalMetaPromptingEngine,
+        CategoricalExecutionResult,
+        create_categorical_engine,
+    )
+    from .monitoring import (
+        QualityMonitor,
+        QualityMetrics,
+        create_quality_monitor,
+    )
+
+# Public name -> subpackage providing it. Resolved on first attribute access
+# (PEP 562) so importing the package does not load the categorical stack.
+_LAZY_EXPORTS = {
+    "Functor": ".categorical",
+    "Monad": ".categorical",
+    "MonadPrompt": ".categorical",
+    "Comonad": ".categorical",
+    "Observation": ".categorical",
+    "CategoricalMetaPromptingEngine": ".categorical",
+    "CategoricalExecutionResult": ".categorical",
+    "create_categorical_engine": ".categorical",
+    "QualityMonitor": ".monitoring",
+    "QualityMetrics": ".monitoring",
+    "create_quality_monitor": ".monitoring",
+}
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Categorical structures
@@ -11,23 +11,71 @@ This module provides the core categorical abstractions:
 All structures come with property-based tests verifying categorical laws.
 """
 
-from .functor import Functor, create_task_to_prompt_functor
-from .monad import Monad, MonadPrompt, create_recursive_meta_monad
-from .comonad import Comonad, Observation, create_context_comonad
-from .graded_comonad import (
-    Tier,
-    GradedObservation,
-    GradedComonad,
-    create_graded_comonad,
-    infer_tier_from_complexity,
-    infer_tier_from_tokens,
-)
-from .engine import (
-    CategoricalMetaPromptingEngine,
-    CategoricalExecutionResult,
-    CategoricalMetaPromptingConfig,
-    create_categorical_engine
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .functor import Functor, create_task_to_prompt_functor
+    from .monad import Monad, MonadPrompt, create_recursive_meta_monad
+    from .comonad import Comonad, ContextComonad, Observation, create_context_comonad
+    from .graded_comonad import (
+        Tier,
+        GradedObservation,
+        GradedComonad,
+        create_graded_comonad,
+        infer_tier_from_complexity,
+        infer_tier_from_tokens,
+    )
+    from .engine import (
+        CategoricalMetaPromptingEngine,
+        CategoricalExecutionResult,
+        CategoricalMetaPromptingConfig,
+        create_categorical_engine
+    )
+
+# Public name -> defining submodule. Resolved on first attribute access
+# (PEP 562), so e.g. importing .comonad does not also load the engine.
+_LAZY_EXPORTS = {
+    # Functor
+    "Functor": ".functor",
+    "create_task_to_prompt_functor": ".functor",
+    # Monad
+    "Monad": ".monad",
+    "MonadPrompt": ".monad",
+    "create_recursive_meta_monad": ".monad",
+    # Comonad
+    "Comonad": ".comonad",
+    "ContextComonad": ".comonad",
+    "Observation": ".comonad",
+    "create_context_comonad": ".comonad",
+    # Graded Comonad (Pattern 1)
+    "Tier": ".graded_comonad",
+    "GradedObservation": ".graded_comonad",
+    "GradedComonad": ".graded_comonad",
+    "create_graded_comonad": ".graded_comonad",
+    "infer_tier_from_complexity": ".graded_comonad",
+    "infer_tier_from_tokens": ".graded_comonad",
+    # Engine
+    "CategoricalMetaPromptingEngine": ".engine",
+    "CategoricalExecutionResult": ".engine",
+    "CategoricalMetaPromptingConfig": ".engine",
+    "create_categorical_engine": ".engine",
+}
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Functor
@@ -39,6 +87,7 @@ __all__ = [
     "create_recursive_meta_monad",
     # Comonad
     "Comonad",
+    "ContextComonad",
     "Observation",
     "create_context_comonad",
     # Graded Comonad (Pattern 1)
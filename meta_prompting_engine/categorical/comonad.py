@@ -38,8 +38,10 @@ Example:
 """
 
 from typing import TypeVar, Callable, Generic, Any, List, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass, InitVar
 from datetime import datetime
+import copy
+import time
 
 from .types import Prompt
 
@@ -47,8 +49,79 @@ from .types import Prompt
 A = TypeVar('A')
 B = TypeVar('B')
 
+# Offset from the monotonic clock to wall-clock time, fixed at import so
+# monotonic observation stamps can be converted to datetimes on demand
+_WALL_CLOCK_OFFSET_NS = time.time_ns() - time.monotonic_ns()
 
-@dataclass
+
+def _lazy_timestamp(self) -> datetime:
+    """
+    Observation time as a datetime, materialized on first access.
+
+    Shared by observation dataclasses that store `timestamp_ns` and a
+    `_timestamp` cache and take `timestamp` as an InitVar. Install with
+    ``cls.timestamp = property(_lazy_timestamp)`` after @dataclass, so the
+    InitVar keeps its None default.
+    """
+    if self._timestamp is None:
+        self._timestamp = datetime.fromtimestamp(
+            (self.timestamp_ns + _WALL_CLOCK_OFFSET_NS) / 1e9
+        )
+    return self._timestamp
+
+
+class _HistoryChain:
+    """
+    Persistent observation history, most recent first.
+
+    A singly-linked chain of (item, rest) cells with the length stored.
+    Prepending shares the existing chain as its tail, so duplicate is
+    O(1) instead of copying the whole history. Chains are never mutated;
+    Observation.history materializes one into a list when first read.
+    """
+
+    __slots__ = ('cell', 'length')
+
+    def __init__(self, cell: Optional[tuple] = None, length: int = 0):
+        self.cell = cell
+        self.length = length
+
+    @classmethod
+    def from_list(cls, items: List['Observation']) -> '_HistoryChain':
+        """Snapshot a history list as a chain, O(n)."""
+        cell = None
+        for item in reversed(items):
+            cell = (item, cell)
+        return cls(cell, len(items))
+
+    def prepend(self, item: 'Observation') -> '_HistoryChain':
+        """New chain with item in front, sharing this one as its tail."""
+        return _HistoryChain((item, self.cell), self.length + 1)
+
+    def to_list(self) -> List['Observation']:
+        items = []
+        cell = self.cell
+        while cell is not None:
+            item, cell = cell
+            items.append(item)
+        return items
+
+    def __eq__(self, other) -> bool:
+        # Compares equal to a chain or list holding the same observations
+        if isinstance(other, _HistoryChain):
+            return self.cell is other.cell or self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    __hash__ = None
+
+
+# Chains are immutable, so every observation without history shares this
+_EMPTY_CHAIN = _HistoryChain()
+
+
+@dataclass(slots=True)
 class Observation(Generic[A]):
     """
     Observation wrapper providing context for comonadic operations.
@@ -62,9 +135,17 @@ class Observation(Generic[A]):
     Attributes:
         current: The focused value (current state)
         context: Full system context at observation time
-        history: List of previous observations for trend analysis
+        history: List of previous observations for trend analysis, most
+            recent first. Observations made by duplicate hold it as a
+            shared persistent chain and build the list on first access.
         metadata: Additional observation metadata
-        timestamp: When observation was made
+        timestamp_ns: When observation was made (time.monotonic_ns())
+        timestamp: Same instant as a datetime; may also be passed to
+            the constructor. Built lazily from timestamp_ns on first access.
+
+    history and timestamp are properties, not dataclass fields, so
+    dataclasses.fields/asdict report timestamp_ns and the private
+    _history/_timestamp instead. Use to_dict for the public view.
 
     Example:
         >>> obs = Observation(
@@ -75,23 +156,101 @@ class Observation(Generic[A]):
     """
     current: A
     context: dict[str, Any]
-    history: List['Observation'] = field(default_factory=list)
+    history: InitVar[Optional[List['Observation']]] = None
     metadata: dict[str, Any] = field(default_factory=dict)
-    timestamp: Optional[datetime] = None
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)
+    timestamp: InitVar[Optional[datetime]] = None
+    _timestamp: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    # The history list, or a _HistoryChain not yet materialized into one
+    _history: Any = field(default=None, init=False, repr=False)
+
+    def __post_init__(self, history: Any, timestamp: Optional[datetime]):
+        """Store history and use an explicitly passed datetime as the observation time."""
+        if history is None:
+            self._history = _EMPTY_CHAIN
+        elif isinstance(history, (list, _HistoryChain)):
+            self._history = history
+        else:
+            self._history = list(history)
+        if timestamp is not None:
+            self._timestamp = timestamp
+            self.timestamp_ns = int(timestamp.timestamp() * 1e9) - _WALL_CLOCK_OFFSET_NS
+
+    @property
+    def history_len(self) -> int:
+        """Number of previous observations, without materializing a chain."""
+        history = self._history
+        if isinstance(history, _HistoryChain):
+            return history.length
+        return len(history)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Public fields as a dict, as dataclasses.asdict returned them.
 
-    def __post_init__(self):
-        """Set timestamp if not provided."""
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+        Keys are current, context, history, metadata and timestamp;
+        nested observations and other dataclasses are converted
+        recursively and other values deep-copied, as asdict does.
+        """
+        return {
+            'current': _asdict_value(self.current),
+            'context': _asdict_value(self.context),
+            'history': [obs.to_dict() for obs in self.history],
+            'metadata': _asdict_value(self.metadata),
+            'timestamp': self.timestamp,
+        }
 
     def __str__(self) -> str:
-        return f"W({type(self.current).__name__}, history={len(self.history)})"
+        return f"W({type(self.current).__name__}, history={self.history_len})"
 
     def __repr__(self) -> str:
         return f"Observation(current={str(self.current)[:50]}, context_keys={list(self.context.keys())})"
 
 
-@dataclass
+def _get_observation_history(self: Observation) -> List[Observation]:
+    """History as a list, built from a shared chain on first access."""
+    history = self._history
+    if isinstance(history, _HistoryChain):
+        history = self._history = history.to_list()
+    return history
+
+
+def _set_observation_history(self: Observation, history: List[Observation]) -> None:
+    self._history = history if isinstance(history, list) else list(history)
+
+
+def _asdict_value(value: Any) -> Any:
+    """Convert value the way dataclasses.asdict does, using Observation.to_dict."""
+    if isinstance(value, Observation):
+        return value.to_dict()
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _asdict_value(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, tuple) and hasattr(value, '_fields'):
+        return type(value)(*map(_asdict_value, value))
+    if isinstance(value, (list, tuple)):
+        return type(value)(map(_asdict_value, value))
+    if isinstance(value, dict):
+        return type(value)(
+            (_asdict_value(k), _asdict_value(v)) for k, v in value.items()
+        )
+    return copy.deepcopy(value)
+
+
+def _history_chain(obs: Observation) -> _HistoryChain:
+    """obs's history as a chain; an O(n) snapshot once it is a list."""
+    history = obs._history
+    if isinstance(history, _HistoryChain):
+        return history
+    return _HistoryChain.from_list(history)
+
+
+# Installed after @dataclass so the `timestamp` and `history` InitVars
+# keep their None defaults
+Observation.timestamp = property(_lazy_timestamp)
+Observation.history = property(_get_observation_history, _set_observation_history)
+
+
+@dataclass(slots=True)
 class Comonad(Generic[A]):
     """
     Comonad W with verified categorical laws.
@@ -115,6 +274,16 @@ class Comonad(Generic[A]):
     extract: Callable[[Observation[A]], A]
     duplicate: Callable[[Observation[A]], Observation[Observation[A]]]
 
+    @staticmethod
+    def create_observation(
+        current: A,
+        context: dict[str, Any],
+        history: Optional[List[Observation]] = None,
+        metadata: Optional[dict[str, Any]] = None
+    ) -> Observation[A]:
+        """Create an observation with context (see module-level create_observation)."""
+        return create_observation(current, context, history, metadata)
+
     def extend(
         self,
         f: Callable[[Observation[A]], B],
@@ -127,9 +296,12 @@ class Comonad(Generic[A]):
         full observation context, not just the current value.
 
         Process:
-        1. duplicate wa to get W(W(A))
-        2. fmap f to get W(B)
-        3. extract inner layer
+        1. apply f to wa
+        2. wrap the result with wa's context and history
+
+        By left identity (extract ∘ duplicate = id) the inner layer of
+        duplicate(wa) is wa itself, so f is applied to wa directly rather
+        than building and discarding the meta-observation.
 
         Args:
             f: Context-aware function W(A) → B
@@ -147,30 +319,30 @@ class Comonad(Generic[A]):
             ...     return assess_quality_from_history(obs)
             >>> quality_obs = comonad.extend(analyze_with_context, output_obs)
         """
-        # duplicate: W(A) → W(W(A))
-        wwa = self.duplicate(wa)
-
-        # fmap f: W(W(A)) → W(B)
-        # Since duplicate puts wa itself as current, we apply f to it
-        transformed_value = f(wwa.current)
+        # fmap f ∘ duplicate: W(A) → W(B)
+        # extract(duplicate(wa)) = wa, so f applies to wa directly
+        transformed_value = f(wa)
 
         # Wrap in observation with original context
         return Observation(
             current=transformed_value,
             context=wa.context,
-            history=wa.history,
+            history=wa._history,  # Shared as-is, without materializing
             metadata={
                 **wa.metadata,
                 'extended': True,
                 'transformation': f.__name__ if hasattr(f, '__name__') else 'lambda'
-            },
-            timestamp=datetime.now()
+            }
         )
 
     def verify_left_identity(self, wa: Observation[A]) -> bool:
         """
         Verify comonad left identity law: extract ∘ duplicate = id
 
+        Law verifiers cost one or two extra duplicates each; runtime
+        callers should guard them with ``__debug__`` so ``python -O``
+        skips them.
+
         Extracting from a duplicated observation should give
         back the original observation.
 
@@ -219,7 +391,7 @@ class Comonad(Generic[A]):
         fmap_extracted = Observation(
             current=self.extract(duplicated.current),
             context=duplicated.context,
-            history=duplicated.history,
+            history=duplicated._history,
             metadata=duplicated.metadata
         )
 
@@ -254,7 +426,7 @@ class Comonad(Generic[A]):
         right_side = Observation(
             current=self.duplicate(duplicated_once.current),
             context=duplicated_once.context,
-            history=duplicated_once.history,
+            history=duplicated_once._history,
             metadata=duplicated_once.metadata
         )
 
@@ -274,57 +446,39 @@ class Comonad(Generic[A]):
 
         Returns:
             True if structurally equal
+
+        Compares with identity first and == after, never str(): the laws
+        hand back the very same objects, and stringifying large payloads
+        is O(n) and lossy.
         """
+        if obs1 is obs2:
+            return True
         if isinstance(obs1, Observation) and isinstance(obs2, Observation):
             return (
-                str(obs1.current) == str(obs2.current) and
+                (obs1.current is obs2.current or obs1.current == obs2.current) and
                 obs1.context.keys() == obs2.context.keys()
             )
         else:
-            return str(obs1) == str(obs2)
+            return obs1 == obs2
 
 
-# Factory function for creating Context Extraction Comonad
-def create_context_comonad() -> Comonad:
+class ContextComonad(Comonad[A]):
     """
-    Factory for creating W: Context Extraction comonad.
-
-    This comonad provides context-aware operations for meta-prompting:
-    - extract ε: Focus on essential result
-    - duplicate δ: Meta-observation (observe the observation)
-    - extend: Transform using full context
+    W: Context Extraction comonad with extract/duplicate fixed on the class.
 
-    Returns:
-        Comonad[Any] with verified laws
-
-    Extract Operation (ε):
-        W(A) → A
-        - Extracts the current focused value
-        - Discards context (but preserves it in observation)
-
-    Duplicate Operation (δ):
-        W(A) → W(W(A))
-        - Creates meta-observation
-        - Inner observation becomes the current value
-        - Outer observation provides meta-context
+    create_context_comonad always builds this same comonad, so its
+    operations are static methods resolved through the class rather
+    than per-instance callables. The generic Comonad stays for
+    user-supplied comonads; extend and the law verifiers are shared.
+    """
 
-    Integration with CC2.0 OBSERVE:
-        This comonad structure matches the CC2.0 framework:
-        - extract = focused view on system health
-        - duplicate = meta-observation of observation quality
-        - extend = context-aware recommendations
+    __slots__ = ()
 
-    Example:
-        >>> comonad = create_context_comonad()
-        >>> obs = comonad.create_observation(
-        ...     current="Maximum is 9",
-        ...     context={"prompt": prompt, "quality": 0.92},
-        ...     history=[prev_obs]
-        ... )
-        >>> result = comonad.extract(obs)  # "Maximum is 9"
-        >>> meta_obs = comonad.duplicate(obs)  # W(W(...))
-    """
+    def __init__(self) -> None:
+        # extract/duplicate are static methods, not per-instance fields
+        pass
 
+    @staticmethod
     def extract(wa: Observation[A]) -> A:
         """
         ε : W(A) → A
@@ -342,6 +496,7 @@ def create_context_comonad() -> Comonad:
         """
         return wa.current
 
+    @staticmethod
     def duplicate(wa: Observation[A]) -> Observation[Observation[A]]:
         """
         δ : W(A) → W(W(A))
@@ -363,22 +518,62 @@ def create_context_comonad() -> Comonad:
             current=wa,  # The observation becomes the current value
             context={
                 'meta_observation': True,
-                'original_context_keys': list(wa.context.keys()),
+                # Snapshot of wa's keys at duplication time
+                'original_context_keys': list(wa.context),
                 'observation_timestamp': wa.timestamp,
-                'history_depth': len(wa.history)
+                'history_depth': wa.history_len
             },
-            history=[wa] + wa.history,  # Prepend current to history
+            # Prepend current to history: O(1) unless wa's history was
+            # read as a list, which is then snapshotted as before
+            history=_history_chain(wa).prepend(wa),
             metadata={
                 'observation_quality': _assess_observation_quality(wa),
                 'completeness': _assess_observation_completeness(wa)
-            },
-            timestamp=datetime.now()
+            }
         )
 
-    # Attach create_observation as utility method
-    comonad = Comonad(extract=extract, duplicate=duplicate)
-    comonad.create_observation = create_observation
-    return comonad
+
+# Factory function for creating Context Extraction Comonad
+def create_context_comonad() -> Comonad:
+    """
+    Factory for creating W: Context Extraction comonad.
+
+    This comonad provides context-aware operations for meta-prompting:
+    - extract ε: Focus on essential result
+    - duplicate δ: Meta-observation (observe the observation)
+    - extend: Transform using full context
+
+    Returns:
+        Comonad[Any] with verified laws
+
+    Extract Operation (ε):
+        W(A) → A
+        - Extracts the current focused value
+        - Discards context (but preserves it in observation)
+
+    Duplicate Operation (δ):
+        W(A) → W(W(A))
+        - Creates meta-observation
+        - Inner observation becomes the current value
+        - Outer observation provides meta-context
+
+    Integration with CC2.0 OBSERVE:
+        This comonad structure matches the CC2.0 framework:
+        - extract = focused view on system health
+        - duplicate = meta-observation of observation quality
+        - extend = context-aware recommendations
+
+    Example:
+        >>> comonad = create_context_comonad()
+        >>> obs = comonad.create_observation(
+        ...     current="Maximum is 9",
+        ...     context={"prompt": prompt, "quality": 0.92},
+        ...     history=[prev_obs]
+        ... )
+        >>> result = comonad.extract(obs)  # "Maximum is 9"
+        >>> meta_obs = comonad.duplicate(obs)  # W(W(...))
+    """
+    return ContextComonad()
 
 
 def create_observation(
@@ -412,11 +607,14 @@ def create_observation(
         current=current,
         context=context,
         history=history or [],
-        metadata=metadata or {},
-        timestamp=datetime.now()
+        metadata=metadata or {}
     )
 
 
+# Context keys a complete observation is expected to carry
+_EXPECTED_CONTEXT_KEYS = frozenset(('prompt', 'quality', 'meta_level'))
+
+
 def _assess_observation_quality(obs: Observation) -> float:
     """
     Assess quality of observation itself (meta-quality).
@@ -432,21 +630,14 @@ def _assess_observation_quality(obs: Observation) -> float:
     Returns:
         Quality score [0.0, 1.0]
     """
-    quality = 0.5  # Base score
-
-    # Context richness
-    if len(obs.context) >= 3:
-        quality += 0.2
-
-    # Has history
-    if len(obs.history) > 0:
-        quality += 0.2
-
-    # Has metadata
-    if obs.metadata:
-        quality += 0.1
-
-    return min(quality, 1.0)
+    # Base score, plus context richness, history depth and metadata
+    return min(
+        0.5
+        + 0.2 * (len(obs.context) >= 3)
+        + 0.2 * (obs.history_len > 0)
+        + 0.1 * bool(obs.metadata),
+        1.0
+    )
 
 
 def _assess_observation_completeness(obs: Observation) -> float:
@@ -456,7 +647,9 @@ def _assess_observation_completeness(obs: Observation) -> float:
     Criteria:
     - Has all expected context keys
     - History is continuous
-    - Timestamps are present
+
+    Every observation carries a timestamp, which accounts for 0.1 of
+    the base score.
 
     Args:
         obs: Observation to assess
@@ -464,19 +657,11 @@ def _assess_observation_completeness(obs: Observation) -> float:
     Returns:
         Completeness score [0.0, 1.0]
     """
-    completeness = 0.6  # Base score
-
-    # Expected context keys present
-    expected_keys = ['prompt', 'quality', 'meta_level']
-    present_keys = sum(1 for k in expected_keys if k in obs.context)
-    completeness += 0.1 * (present_keys / len(expected_keys))
-
-    # Has timestamp
-    if obs.timestamp is not None:
-        completeness += 0.1
-
-    # History is reasonable
-    if 0 < len(obs.history) <= 10:  # Some history but not excessive
-        completeness += 0.1
-
-    return min(completeness, 1.0)
+    # Base score (including timestamp), plus expected context keys present
+    # and some history but not excessive
+    return min(
+        0.7
+        + 0.1 * (len(obs.context.keys() & _EXPECTED_CONTEXT_KEYS) / len(_EXPECTED_CONTEXT_KEYS))
+        + 0.1 * (0 < obs.history_len <= 10),
+        1.0
+    )
@@ -6,9 +6,60 @@ drives strategy selection in the F: Tasks → Prompts functor.
 """
 
 from .types import Task, ComplexityAnalysis
+from functools import lru_cache
+from typing import List, NamedTuple, Sequence, Tuple
 import re
 
 
+# Keyword tables, built once at import rather than on every call.
+# Matching stays plain `kw in text`: CPython's substring search beats a
+# compiled regex alternation for keyword lists this short.
+
+# Algorithmic complexity keywords
+HIGH_COMPLEXITY_KEYWORDS = (
+    'optimize', 'minimize', 'maximum', 'recursive',
+    'dynamic programming', 'backtrack', 'np-hard',
+    'algorithm', 'complexity', 'efficient'
+)
+MEDIUM_COMPLEXITY_KEYWORDS = (
+    'search', 'sort', 'filter', 'transform',
+    'group', 'aggregate', 'merge', 'split'
+)
+LOW_COMPLEXITY_KEYWORDS = (
+    'find', 'count', 'sum', 'max', 'min',
+    'first', 'last', 'get', 'list'
+)
+
+# Domain-specific task types
+HIGH_DOMAIN_TYPES = ('quantum', 'biology', 'finance', 'medical', 'legal')
+MEDIUM_DOMAIN_TYPES = ('coding', 'math', 'data', 'analysis')
+
+# Vague language indicating ambiguity
+VAGUE_WORDS = ('somehow', 'maybe', 'kind of', 'sort of', 'approximately')
+
+# Large scale indicators
+LARGE_SCALE_KEYWORDS = ('million', 'billion', 'large', 'huge', 'massive', 'stream', 'big data')
+
+_NUMBER_RE = re.compile(r'\d+')
+
+
+class ComplexityDimensions(NamedTuple):
+    """Per-dimension complexity scores, in weighting order."""
+    algorithmic: float
+    domain: float
+    ambiguity: float
+    scale: float
+
+
+# Weight of each dimension in the overall score
+DIMENSION_WEIGHTS = ComplexityDimensions(
+    algorithmic=0.4,
+    domain=0.3,
+    ambiguity=0.2,
+    scale=0.1
+)
+
+
 def analyze_complexity(task: Task) -> ComplexityAnalysis:
     """
     Analyze task complexity across multiple dimensions.
@@ -30,38 +81,79 @@ def analyze_complexity(task: Task) -> ComplexityAnalysis:
         >>> analysis = analyze_complexity(task)
         >>> assert 0.2 <= analysis.overall <= 0.4  # Low complexity
     """
-    dimensions = {}
+    overall, dimensions = _analyze_cached(
+        task.description,
+        task.type,
+        bool(task.examples),
+        bool(task.constraints)
+    )
 
-    # Algorithmic complexity (based on keywords and structure)
-    dimensions['algorithmic'] = _analyze_algorithmic_complexity(task)
+    return ComplexityAnalysis(
+        overall=overall,
+        dimensions=dimensions._asdict(),
+        confidence=0.85  # Heuristic-based, moderate confidence
+    )
 
-    # Domain knowledge requirement
-    dimensions['domain'] = _analyze_domain_complexity(task)
 
-    # Ambiguity in specification
-    dimensions['ambiguity'] = _analyze_ambiguity(task)
+def analyze_complexity_batch(tasks: Sequence[Task]) -> List[ComplexityAnalysis]:
+    """
+    Analyze many tasks at once.
 
-    # Scale (input/output size)
-    dimensions['scale'] = _analyze_scale(task)
+    Equivalent to [analyze_complexity(t) for t in tasks]. Tasks sharing
+    a fingerprint (description, type, presence of examples/constraints)
+    are scored once via the analysis cache; every task still gets its
+    own ComplexityAnalysis.
 
-    # Overall = weighted average
-    weights = {
-        'algorithmic': 0.4,
-        'domain': 0.3,
-        'ambiguity': 0.2,
-        'scale': 0.1
-    }
+    Args:
+        tasks: Tasks to analyze
 
-    overall = sum(dimensions[k] * weights[k] for k in dimensions)
+    Returns:
+        One ComplexityAnalysis per task, in order
+    """
+    return [analyze_complexity(task) for task in tasks]
 
-    return ComplexityAnalysis(
-        overall=overall,
-        dimensions=dimensions,
-        confidence=0.85  # Heuristic-based, moderate confidence
+
+@lru_cache(maxsize=4096)
+def _analyze_cached(
+    description: str,
+    task_type: str,
+    has_examples: bool,
+    has_constraints: bool
+) -> Tuple[float, ComplexityDimensions]:
+    """
+    Score a task from the only fields the analysis reads.
+
+    Cached so a task flowing through a pipeline several times is analyzed
+    once. Returns (overall, dimensions); dimensions is immutable, so the
+    cached value can be shared.
+    """
+    # Lowercase once; every keyword check below reads this copy
+    desc_lower = description.lower()
+
+    dimensions = ComplexityDimensions(
+        # Algorithmic complexity (based on keywords and structure)
+        algorithmic=_analyze_algorithmic_complexity(desc_lower),
+        # Domain knowledge requirement
+        domain=_analyze_domain_complexity(task_type),
+        # Ambiguity in specification
+        ambiguity=_analyze_ambiguity(desc_lower, has_examples, has_constraints),
+        # Scale (input/output size)
+        scale=_analyze_scale(desc_lower)
     )
 
+    # Overall = weighted average
+    algorithmic, domain, ambiguity, scale = dimensions
+    overall = (
+        algorithmic * DIMENSION_WEIGHTS.algorithmic
+        + domain * DIMENSION_WEIGHTS.domain
+        + ambiguity * DIMENSION_WEIGHTS.ambiguity
+        + scale * DIMENSION_WEIGHTS.scale
+    )
+
+    return overall, dimensions
+
 
-def _analyze_algorithmic_complexity(task: Task) -> float:
+def _analyze_algorithmic_complexity(desc_lower: str) -> float:
     """
     Analyze algorithmic complexity based on task description keywords.
 
@@ -71,38 +163,39 @@ def _analyze_algorithmic_complexity(task: Task) -> float:
     - Low: find, count, sum, max, min
 
     Args:
-        task: Input task
+        desc_lower: Lowercased task description
 
     Returns:
         Algorithmic complexity [0.0, 1.0]
     """
-    desc_lower = task.description.lower()
-
-    # High complexity keywords
-    high_keywords = [
-        'optimize', 'minimize', 'maximum', 'recursive',
-        'dynamic programming', 'backtrack', 'np-hard',
-        'algorithm', 'complexity', 'efficient'
+    # Count keyword matches
+    high_count = sum(1 for kw in HIGH_COMPLEXITY_KEYWORDS if kw in desc_lower)
+    medium_count = sum(1 for kw in MEDIUM_COMPLEXITY_KEYWORDS if kw in desc_lower)
+    low_count = sum(1 for kw in LOW_COMPLEXITY_KEYWORDS if kw in desc_lower)
+
+    # Counts saturate at 3, so every outcome is in the precomputed table
+    return _ALGORITHMIC_SCORES[
+        (high_count if high_count < 3 else 3) * 16
+        + (medium_count if medium_count < 3 else 3) * 4
+        + (low_count if low_count < 3 else 3)
     ]
 
-    # Medium complexity keywords
-    medium_keywords = [
-        'search', 'sort', 'filter', 'transform',
-        'group', 'aggregate', 'merge', 'split'
-    ]
 
-    # Low complexity keywords
-    low_keywords = [
-        'find', 'count', 'sum', 'max', 'min',
-        'first', 'last', 'get', 'list'
-    ]
+def _algorithmic_score(high_count: int, medium_count: int, low_count: int) -> float:
+    """
+    Score algorithmic complexity from keyword counts per tier.
 
-    # Count keyword matches
-    high_count = sum(1 for kw in high_keywords if kw in desc_lower)
-    medium_count = sum(1 for kw in medium_keywords if kw in desc_lower)
-    low_count = sum(1 for kw in low_keywords if kw in desc_lower)
+    The most complex tier with any match decides the band; more matches
+    (up to 3) move the score up within that band.
 
-    # Compute score
+    Args:
+        high_count: Number of high complexity keywords matched
+        medium_count: Number of medium complexity keywords matched
+        low_count: Number of low complexity keywords matched
+
+    Returns:
+        Algorithmic complexity [0.0, 1.0]
+    """
     if high_count > 0:
         return 0.8 + (0.2 * min(high_count / 3, 1.0))
     elif medium_count > 0:
@@ -113,7 +206,18 @@ def _analyze_algorithmic_complexity(task: Task) -> float:
         return 0.5  # Default if no keywords match
 
 
-def _analyze_domain_complexity(task: Task) -> float:
+# _algorithmic_score for every (high, medium, low) count in 0..3, indexed by
+# high * 16 + medium * 4 + low. Replaces the per-call if/elif cascade and
+# float arithmetic with a single lookup.
+_ALGORITHMIC_SCORES = tuple(
+    _algorithmic_score(high, medium, low)
+    for high in range(4)
+    for medium in range(4)
+    for low in range(4)
+)
+
+
+def _analyze_domain_complexity(task_type: str) -> float:
     """
     Analyze domain knowledge requirement.
 
@@ -123,27 +227,22 @@ def _analyze_domain_complexity(task: Task) -> float:
     - Low: basic operations
 
     Args:
-        task: Input task
+        task_type: Task type (coding, math, ...)
 
     Returns:
         Domain complexity [0.0, 1.0]
     """
-    # Domain-specific task types
-    high_domain_types = ['quantum', 'biology', 'finance', 'medical', 'legal']
-    medium_domain_types = ['coding', 'math', 'data', 'analysis']
-    low_domain_types = ['general', 'text', 'simple']
-
-    task_type = task.type.lower()
+    task_type = task_type.lower()
 
-    if any(d in task_type for d in high_domain_types):
+    if any(d in task_type for d in HIGH_DOMAIN_TYPES):
         return 0.8
-    elif any(d in task_type for d in medium_domain_types):
+    elif any(d in task_type for d in MEDIUM_DOMAIN_TYPES):
         return 0.4
     else:
         return 0.2
 
 
-def _analyze_ambiguity(task: Task) -> float:
+def _analyze_ambiguity(desc_lower: str, has_examples: bool, has_constraints: bool) -> float:
     """
     Analyze ambiguity in task specification.
 
@@ -153,34 +252,33 @@ def _analyze_ambiguity(task: Task) -> float:
     - Low: clear, specific, with examples
 
     Args:
-        task: Input task
+        desc_lower: Lowercased task description
+        has_examples: Whether the task provides examples
+        has_constraints: Whether the task provides constraints
 
     Returns:
         Ambiguity score [0.0, 1.0]
     """
     # Low ambiguity: has examples and constraints
-    if task.examples and task.constraints:
+    if has_examples and has_constraints:
         return 0.2
 
     # Medium ambiguity: has either examples or constraints
-    if task.examples or task.constraints:
+    if has_examples or has_constraints:
         return 0.5
 
     # High ambiguity: vague language
-    vague_words = ['somehow', 'maybe', 'kind of', 'sort of', 'approximately']
-    desc_lower = task.description.lower()
-
-    if any(word in desc_lower for word in vague_words):
+    if any(word in desc_lower for word in VAGUE_WORDS):
         return 0.9
 
     # Check for question marks (often indicates ambiguity)
-    if '?' in task.description and len(task.description.split('?')) > 2:
+    if desc_lower.count('?') >= 2:
         return 0.7
 
     return 0.6  # Default moderate ambiguity
 
 
-def _analyze_scale(task: Task) -> float:
+def _analyze_scale(desc_lower: str) -> float:
     """
     Analyze input/output scale.
 
@@ -190,31 +288,28 @@ def _analyze_scale(task: Task) -> float:
     - Low: small inputs
 
     Args:
-        task: Input task
+        desc_lower: Lowercased task description
 
     Returns:
         Scale complexity [0.0, 1.0]
     """
-    desc_lower = task.description.lower()
-
-    # Large scale indicators
-    large_keywords = ['million', 'billion', 'large', 'huge', 'massive', 'stream', 'big data']
-
-    # Extract numbers from description
-    numbers = re.findall(r'\d+', task.description)
-
     # Check for large scale keywords
-    if any(kw in desc_lower for kw in large_keywords):
+    if any(kw in desc_lower for kw in LARGE_SCALE_KEYWORDS):
         return 0.9
 
-    # Check for large numbers
-    if numbers:
-        max_num = max(int(n) for n in numbers)
-        if max_num > 1_000_000:
-            return 0.9
-        elif max_num > 10_000:
-            return 0.6
-        elif max_num > 1_000:
-            return 0.3
+    # Largest number mentioned, in one pass; any number past a million
+    # settles the score, so stop there
+    max_num = 0
+    for match in _NUMBER_RE.finditer(desc_lower):
+        num = int(match.group())
+        if num > max_num:
+            if num > 1_000_000:
+                return 0.9
+            max_num = num
+
+    if max_num > 10_000:
+        return 0.6
+    elif max_num > 1_000:
+        return 0.3
 
     return 0.2  # Default small scale
@@ -37,11 +37,18 @@ Example:
     >>> refined = contextad.extend(analyze_with_full_context)
 """
 
-from typing import TypeVar, Callable, Generic, Any, Dict, List, Optional, Protocol
-from dataclasses import dataclass, field
+from typing import TypeVar, Callable, Generic, Any, Dict, FrozenSet, List, Optional, Protocol, Tuple
+from dataclasses import dataclass, field, InitVar
 from datetime import datetime
 from abc import ABC, abstractmethod
-
+from concurrent.futures import Future
+from contextvars import ContextVar
+from hashlib import blake2b
+import heapq
+import threading
+import time
+
+from .comonad import _WALL_CLOCK_OFFSET_NS, _lazy_timestamp
 from .graded_comonad import Tier, GradedObservation, GradedComonad, create_graded_comonad
 
 # Type variables
@@ -49,6 +56,20 @@ A = TypeVar('A')  # Value type
 E = TypeVar('E')  # External context type (tools, knowledge)
 B = TypeVar('B')  # Result type
 
+# Default-retrieval results kept per knowledge base (least recently used
+# entries are dropped first)
+RETRIEVE_CACHE_SIZE = 1024
+
+
+def chunk_id(doc: str) -> str:
+    """
+    Stable identifier for a retrieved document (chunk).
+
+    Depends only on the document text, so a downstream cache (e.g. of
+    per-chunk KV blocks) can recognize the same chunk across prompts.
+    """
+    return blake2b(doc.encode(), digest_size=8).hexdigest()
+
 
 class Action(Protocol[E, A]):
     """Protocol for actegory actions."""
@@ -58,7 +79,21 @@ class Action(Protocol[E, A]):
         ...
 
 
-@dataclass
+# Coalesced tool calls in progress: (tool id, sorted kwargs) -> result Future.
+# Entries live only while their leading call runs, so the tool id stays valid
+_CoalesceKey = Tuple[int, Tuple[Tuple[str, Any], ...]]
+_inflight_calls: Dict[_CoalesceKey, Future] = {}
+_inflight_lock = threading.Lock()
+
+# Calls led in the current context. Copied into asyncio.to_thread and
+# contextvars.copy_context().run, so work a leading call hands to another
+# thread that way is recognized as re-entrant too
+_leading_calls: ContextVar[FrozenSet[_CoalesceKey]] = ContextVar(
+    '_leading_calls', default=frozenset()
+)
+
+
+@dataclass(slots=True)
 class Tool:
     """
     Representation of an external tool (MCP-style).
@@ -68,20 +103,63 @@ class Tool:
         description: What the tool does
         parameters: Expected parameters
         execute: Function to execute the tool
+        coalesce: Share one execution among concurrent identical calls.
+            Only for tools without side effects (e.g. lookups,
+            summarizers); calls with unhashable arguments always run.
     """
     name: str
     description: str
     parameters: Dict[str, Any] = field(default_factory=dict)
     execute: Callable[[Dict[str, Any]], Any] = None
+    coalesce: bool = False
 
     def __call__(self, **kwargs) -> Any:
         """Execute the tool with given parameters."""
         if self.execute:
+            if self.coalesce:
+                return self._execute_coalesced(kwargs)
             return self.execute(kwargs)
         return f"[Tool:{self.name}] executed with {kwargs}"
 
+    def _execute_coalesced(self, kwargs: Dict[str, Any]) -> Any:
+        """Execute, or wait for an identical call already in progress."""
+        key = (id(self), tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return self.execute(kwargs)
 
-@dataclass
+        leading = _leading_calls.get()
+        if key in leading:
+            # Re-entrant call from this call's own execution: waiting on
+            # its future would deadlock, so run it directly
+            return self.execute(kwargs)
+
+        with _inflight_lock:
+            future = _inflight_calls.get(key)
+            leader = future is None
+            if leader:
+                future = _inflight_calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        token = _leading_calls.set(leading | {key})
+        try:
+            result = self.execute(kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            _leading_calls.reset(token)
+            with _inflight_lock:
+                del _inflight_calls[key]
+        return result
+
+
+@dataclass(slots=True)
 class KnowledgeBase:
     """
     Representation of external knowledge (RAG-style).
@@ -95,23 +173,112 @@ class KnowledgeBase:
     retriever: Callable[[str], List[str]] = None
     documents: List[str] = field(default_factory=list)
 
+    # Inverted index (word -> positions of documents containing it) and
+    # default-retrieval cache, valid while documents match the snapshot
+    _cached_documents: List[str] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _word_index: Dict[str, List[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _descending_order: Optional[List[int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _retrieve_cache: Dict[Tuple[FrozenSet[str], int], List[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def add_document(self, doc: str) -> None:
+        """Add a document, indexing its words without a full rebuild."""
+        self.documents.append(doc)
+        self._cached_documents.append(doc)
+        self._index_document(len(self._cached_documents) - 1, doc)
+        self._descending_order = None
+        self._retrieve_cache.clear()
+
+    def _index_document(self, position: int, doc: str) -> None:
+        """Record the document at position under each of its words."""
+        index = self._word_index
+        for word in set(doc.lower().split()):
+            postings = index.get(word)
+            if postings is None:
+                index[word] = [position]
+            else:
+                postings.append(position)
+
     def retrieve(self, query: str, k: int = 3) -> List[str]:
-        """Retrieve relevant knowledge."""
+        """
+        Retrieve relevant knowledge.
+
+        Default keyword retrieval is memoized: scores depend only on the
+        set of query words, so queries with the same words (in any order
+        or case) share one entry. The cache is dropped whenever documents
+        change. Custom retrievers are always called.
+        """
         if self.retriever:
             return self.retriever(query)[:k]
 
-        # Default: keyword matching
-        query_words = set(query.lower().split())
-        scored = []
-        for doc in self.documents:
-            doc_words = set(doc.lower().split())
-            score = len(query_words & doc_words)
-            scored.append((score, doc))
+        return self.retrieve_by_words(frozenset(query.lower().split()), k)
 
-        return [doc for _, doc in sorted(scored, reverse=True)[:k]]
+    def retrieve_by_words(self, query_words: FrozenSet[str], k: int = 3) -> List[str]:
+        """
+        Default keyword retrieval for an already tokenized query.
 
+        query_words is the set of lowercased query words, as retrieve
+        builds it; callers querying several knowledge bases tokenize once.
+        Ignores any custom retriever.
+        """
+        # Comparing with the snapshot is a pointer walk for unchanged
+        # documents; any other change re-indexes them all
+        if self.documents != self._cached_documents:
+            self._cached_documents = list(self.documents)
+            self._word_index = {}
+            for position, doc in enumerate(self._cached_documents):
+                self._index_document(position, doc)
+            self._descending_order = None
+            self._retrieve_cache.clear()
+
+        key = (query_words, k)
+        cache = self._retrieve_cache
+        if key in cache:
+            # Move to the end: most recently used
+            results = cache[key] = cache.pop(key)
+            return list(results)
+
+        # Default: keyword matching. Only documents sharing a word with the
+        # query are scored; score = number of shared words
+        documents = self._cached_documents
+        scores: Dict[int, int] = {}
+        for word in query_words:
+            for position in self._word_index.get(word, ()):
+                scores[position] = scores.get(position, 0) + 1
+
+        top = heapq.nlargest(
+            k, [(score, documents[position]) for position, score in scores.items()]
+        )
+
+        # Too few matches: fill with unmatched (score 0) documents, in the
+        # same descending order a full sort would give them
+        if len(top) < k:
+            if self._descending_order is None:
+                self._descending_order = sorted(
+                    range(len(documents)), key=documents.__getitem__, reverse=True
+                )
+            for position in self._descending_order:
+                if position not in scores:
+                    top.append((0, documents[position]))
+                    if len(top) == k:
+                        break
+
+        results = [doc for _, doc in top]
+
+        if len(cache) >= RETRIEVE_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = results
+        return list(results)
 
-@dataclass
+
+@dataclass(slots=True)
 class ExternalContext:
     """
     External context containing tools and knowledge.
@@ -135,6 +302,20 @@ class ExternalContext:
         """Register a knowledge base."""
         self.knowledge[kb.name] = kb
 
+    def with_added_tools(self, tools: List[Tool]) -> 'ExternalContext':
+        """
+        Copy of this context with extra tools registered.
+
+        Later tools win on name clashes. The knowledge and metadata dicts
+        are shallow-copied, so registering on either context leaves the
+        other unchanged.
+        """
+        return ExternalContext(
+            tools={**self.tools, **{tool.name: tool for tool in tools}},
+            knowledge={**self.knowledge},
+            metadata={**self.metadata},
+        )
+
     def get_tool(self, name: str) -> Optional[Tool]:
         """Get tool by name."""
         return self.tools.get(name)
@@ -145,14 +326,18 @@ class ExternalContext:
             kb = self.knowledge.get(kb_name)
             return kb.retrieve(query) if kb else []
 
-        # Search all knowledge bases
+        # Search all knowledge bases, tokenizing the query only once
+        query_words = frozenset(query.lower().split())
         results = []
         for kb in self.knowledge.values():
-            results.extend(kb.retrieve(query, k=2))
+            if kb.retriever:
+                results.extend(kb.retrieve(query, k=2))
+            else:
+                results.extend(kb.retrieve_by_words(query_words, k=2))
         return results
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextadObservation(Generic[A]):
     """
     Observation in a contextad - unifying comonadic and actegory context.
@@ -166,6 +351,9 @@ class ContextadObservation(Generic[A]):
         external: External context (actegory)
         actions_applied: Log of actions applied
         metadata: Additional metadata
+        timestamp: Observation time as a datetime; may also be passed to
+            the constructor. Built lazily from timestamp_ns on first access.
+        timestamp_ns: Observation time (time.monotonic_ns())
     """
     value: A
     grade: Tier
@@ -173,11 +361,14 @@ class ContextadObservation(Generic[A]):
     external: ExternalContext = field(default_factory=ExternalContext)
     actions_applied: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: Optional[datetime] = None
+    timestamp: InitVar[Optional[datetime]] = None
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)
+    _timestamp: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
 
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+    def __post_init__(self, timestamp: Optional[datetime]):
+        if timestamp is not None:
+            self._timestamp = timestamp
+            self.timestamp_ns = int(timestamp.timestamp() * 1e9) - _WALL_CLOCK_OFFSET_NS
 
     @property
     def history_depth(self) -> int:
@@ -198,13 +389,16 @@ class ContextadObservation(Generic[A]):
         return (
             f"Contextad[{self.grade.name}]("
             f"value={str(self.value)[:30]}..., "
-            f"history={self.history_depth}, "
-            f"tools={len(self.available_tools)}, "
-            f"knowledge={len(self.available_knowledge)})"
+            f"history={len(self.history)}, "
+            f"tools={len(self.external.tools)}, "
+            f"knowledge={len(self.external.knowledge)})"
         )
 
 
-@dataclass
+ContextadObservation.timestamp = property(_lazy_timestamp)
+
+
+@dataclass(slots=True)
 class Contextad:
     """
     Contextad: Unified Comonad + Actegory.
@@ -269,12 +463,22 @@ class Contextad:
         Returns:
             Focused value (possibly truncated by grade)
         """
+        graded_comonad = self.graded_comonad
+
+        # The stock graded extract reads only (value, grade): apply it
+        # directly instead of wrapping ctx in a throwaway GradedObservation
+        if type(graded_comonad).extract is GradedComonad.extract:
+            value = ctx.value
+            if isinstance(value, str):
+                return graded_comonad._truncate_to_budget(value, ctx.grade)
+            return value
+
         # Delegate to graded comonad for grade-bounded extraction
         graded_obs = GradedObservation(
             current=ctx.value,
             grade=ctx.grade,
         )
-        return self.graded_comonad.extract(graded_obs)
+        return graded_comonad.extract(graded_obs)
 
     def duplicate(
         self,
@@ -373,6 +577,45 @@ class Contextad:
             }
         )
 
+    def act_many(
+        self,
+        ctx: ContextadObservation[A],
+        actions: List[Tuple[Callable[[ExternalContext, A], A], str]]
+    ) -> ContextadObservation[A]:
+        """
+        Apply several external actions in order.
+
+        Equivalent to chaining act once per (action, action_name) pair,
+        but builds only the final observation instead of one per action.
+
+        Args:
+            ctx: Contextad observation
+            actions: (action, action_name) pairs, applied first to last
+
+        Returns:
+            Observation with all actions applied (ctx itself if none)
+        """
+        if not actions:
+            return ctx
+
+        value = ctx.value
+        action_names = []
+        for action, action_name in actions:
+            value = action(ctx.external, value)
+            action_names.append(action_name)
+
+        return ContextadObservation(
+            value=value,
+            grade=ctx.grade,
+            history=ctx.history,  # Preserve history
+            external=ctx.external,  # Preserve external context
+            actions_applied=ctx.actions_applied + action_names,
+            metadata={
+                **ctx.metadata,
+                'last_action': action_name,
+            }
+        )
+
     def use_tool(
         self,
         ctx: ContextadObservation[str],
@@ -418,18 +661,26 @@ class Contextad:
             kb_name: Specific knowledge base (all if not provided)
 
         Returns:
-            Observation augmented with retrieved knowledge
+            Observation augmented with retrieved knowledge. Its metadata
+            lists the chunk_id of each retrieved document, in order, under
+            'retrieved_chunk_ids'.
         """
+        retrieved: List[str] = []
+
         def retrieve_action(external: ExternalContext, value: str) -> str:
             search_query = query or value
-            retrieved = external.retrieve_knowledge(search_query, kb_name)
+            retrieved.extend(external.retrieve_knowledge(search_query, kb_name))
 
             if retrieved:
                 knowledge_text = "\n".join(f"- {doc}" for doc in retrieved)
                 return f"{value}\n\nRetrieved knowledge:\n{knowledge_text}"
             return value
 
-        return self.act(ctx, retrieve_action, f"retrieve:{kb_name or 'all'}")
+        augmented = self.act(ctx, retrieve_action, f"retrieve:{kb_name or 'all'}")
+
+        # Identify each retrieved chunk, in prompt order, for downstream caches
+        augmented.metadata['retrieved_chunk_ids'] = tuple(chunk_id(doc) for doc in retrieved)
+        return augmented
 
     # === Unified Operations ===
 
@@ -480,16 +731,12 @@ class Contextad:
         Returns:
             Upgraded observation
         """
-        # Upgrade grade
-        upgraded = ContextadObservation(
+        # Upgrade grade and add new tools in one step
+        return ContextadObservation(
             value=ctx.value,
             grade=new_grade,
             history=ctx.history,
-            external=ExternalContext(
-                tools={**ctx.external.tools},
-                knowledge={**ctx.external.knowledge},
-                metadata={**ctx.external.metadata},
-            ),
+            external=ctx.external.with_added_tools(additional_tools),
             actions_applied=ctx.actions_applied,
             metadata={
                 **ctx.metadata,
@@ -497,12 +744,6 @@ class Contextad:
             }
         )
 
-        # Add new tools
-        for tool in additional_tools:
-            upgraded.external.add_tool(tool)
-
-        return upgraded
-
     # === Law Verification ===
 
     def verify_comonad_laws(self, ctx: ContextadObservation[A]) -> Dict[str, bool]:
@@ -514,17 +755,18 @@ class Contextad:
         2. Right identity: (fmap extract) ∘ duplicate = id
         3. Associativity: duplicate ∘ duplicate = (fmap duplicate) ∘ duplicate
         """
-        # Left identity
+        # duplicate is pure, so all three laws share one duplicate(ctx)
         duplicated = self.duplicate(ctx)
+
+        # Left identity
         extracted = self.extract(duplicated)
-        left_identity = str(extracted.value) == str(ctx.value)
+        left_identity = extracted.value is ctx.value or extracted.value == ctx.value
 
         # Right identity (structural check)
-        duplicated = self.duplicate(ctx)
         right_identity = duplicated.value.value == ctx.value
 
         # Associativity (structural check)
-        dup_dup = self.duplicate(self.duplicate(ctx))
+        dup_dup = self.duplicate(duplicated)
         associativity = isinstance(dup_dup.value.value, ContextadObservation)
 
         return {
@@ -547,7 +789,7 @@ class Contextad:
         2. Action composition: act(a1) ∘ act(a2) = act(a1 ∘ a2)
         """
         # Identity action
-        identity_action = lambda ext, val: val
+        identity_action = _identity_action
         acted_id = self.act(ctx, identity_action, "identity")
         identity_law = acted_id.value == ctx.value
 
@@ -563,6 +805,11 @@ class Contextad:
         }
 
 
+def _identity_action(external: ExternalContext, value: A) -> A:
+    """The identity actegory action."""
+    return value
+
+
 # === Factory Functions ===
 
 def create_contextad() -> Contextad:
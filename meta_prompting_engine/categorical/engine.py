@@ -23,10 +23,14 @@ References:
     - CC2.0: OBSERVE framework for comonadic context extraction
 """
 
-from dataclasses import dataclass, field
-from typing import Generic, TypeVar, Callable, Optional, List, Dict, Any
+from dataclasses import dataclass, field, replace
+from typing import Generic, TypeVar, Callable, Optional, List, Dict, Any, Tuple, Union
 from datetime import datetime
+from hashlib import blake2b
+import asyncio
 import logging
+import threading
+import time
 
 from .types import Task, Prompt, QualityScore, Strategy
 from .functor import Functor, create_task_to_prompt_functor
@@ -42,8 +46,13 @@ B = TypeVar('B')
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Prometheus metrics shared by every engine (the default registry rejects
+# duplicate names), created on first use
+_prometheus_metrics: Optional[Dict[str, Any]] = None
+_prometheus_lock = threading.Lock()
 
-@dataclass
+
+@dataclass(slots=True)
 class CategoricalExecutionResult:
     """
     Result of categorical meta-prompting execution.
@@ -92,7 +101,7 @@ class CategoricalExecutionResult:
             self.quality_improvement = self.final_quality - self.initial_quality
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoricalMetaPromptingConfig:
     """
     Configuration for categorical meta-prompting engine.
@@ -110,11 +119,25 @@ class CategoricalMetaPromptingConfig:
     # Iteration settings
     max_iterations: int = 5
     early_stopping: bool = True
+    # Stop after this many consecutive sub-min_quality_improvement steps;
+    # 0 (the default) disables plateau stopping
+    plateau_patience: int = 0
+
+    # Result caching: repeated identical tasks (e.g. benchmark reruns)
+    # return the earlier result instead of calling the LLM again
+    enable_result_cache: bool = False
+    result_cache_size: int = 1024
+
+    # Prompt caching: identical prompt text (also across different tasks)
+    # reuses the earlier completion. Only for deterministic models
+    enable_prompt_cache: bool = False
+    prompt_cache_size: int = 4096
 
     # Categorical verification
     verify_functor_laws: bool = True
     verify_monad_laws: bool = True
     verify_comonad_laws: bool = True
+    verify_sample_rate: int = 1  # Verify 1 in N executions that request it
 
     # Feature flags for gradual rollout
     enable_categorical_engine: bool = True
@@ -129,6 +152,13 @@ class CategoricalMetaPromptingConfig:
     debug_mode: bool = False
     verbose_logging: bool = False
 
+    def __post_init__(self):
+        """Ensure verify_sample_rate is a positive sampling interval."""
+        if self.verify_sample_rate < 1:
+            raise ValueError(
+                f"verify_sample_rate must be >= 1, got {self.verify_sample_rate}"
+            )
+
 
 class CategoricalMetaPromptingEngine:
     """
@@ -179,25 +209,37 @@ class CategoricalMetaPromptingEngine:
             llm_client: LLM client with .complete(prompt: str) → str method
             config: Optional configuration (uses defaults if not provided)
         """
-        self.llm_client = llm_client
         self.config = config or CategoricalMetaPromptingConfig()
+        if self.config.enable_prompt_cache:
+            llm_client = _CachingLLMClient(llm_client, self.config.prompt_cache_size)
+        self.llm_client = llm_client
 
         # Initialize categorical structures
-        self.functor: Functor = create_task_to_prompt_functor()
+        self.functor: Functor = create_task_to_prompt_functor(llm_client)
         self.monad: Monad = create_recursive_meta_monad(
             llm_client=llm_client,
             quality_threshold=self.config.quality_threshold
         )
         self.comonad: Comonad = create_context_comonad()
 
-        # Execution state
+        # Execution state (guarded so execute_batch can run tasks concurrently)
         self._execution_count = 0
+        self._verify_request_count = 0  # Executions that requested verify_laws
         self._total_quality_improvement = 0.0
+        self._stats_lock = threading.Lock()
+
+        # Results of earlier executions, least recently used first
+        self._result_cache: Dict[Tuple, CategoricalExecutionResult] = {}
+        self._result_cache_hits = 0
+
+        self._prometheus_metrics = (
+            _init_prometheus() if self.config.export_prometheus_metrics else None
+        )
 
         logger.info(
-            f"CategoricalMetaPromptingEngine initialized with "
-            f"quality_threshold={self.config.quality_threshold}, "
-            f"max_iterations={self.config.max_iterations}"
+            "CategoricalMetaPromptingEngine initialized with "
+            "quality_threshold=%s, max_iterations=%s",
+            self.config.quality_threshold, self.config.max_iterations
         )
 
     def execute(
@@ -220,21 +262,47 @@ class CategoricalMetaPromptingEngine:
             task: Task to execute
             max_iterations: Override config max_iterations
             quality_threshold: Override config quality_threshold
-            verify_laws: Verify categorical laws at runtime
+            verify_laws: Verify categorical laws at runtime (subject to
+                config.verify_sample_rate)
 
         Returns:
             CategoricalExecutionResult with output, quality, and trace
         """
+        cache_key = None
+        if self.config.enable_result_cache:
+            cache_key = _result_cache_key(
+                task, max_iterations, quality_threshold, verify_laws
+            )
+            with self._stats_lock:
+                cached = self._result_cache.pop(cache_key, None)
+                if cached is not None:
+                    # Move to the end: most recently used
+                    self._result_cache[cache_key] = cached
+                    self._result_cache_hits += 1
+            if cached is not None:
+                logger.info("Result cache hit: %.50s...", task.description)
+                return replace(cached, metadata={**cached.metadata, 'cache_hit': True})
+
         start_time = datetime.now()
-        self._execution_count += 1
+        start_ns = time.perf_counter_ns()
+        with self._stats_lock:
+            self._execution_count += 1
+            execution_id = self._execution_count
+            # Law checks cost extra LLM calls; only every Nth execution
+            # that requests them runs them
+            if verify_laws:
+                self._verify_request_count += 1
+                verify_laws = (
+                    (self._verify_request_count - 1) % self.config.verify_sample_rate == 0
+                )
 
         # Override config if provided
         max_iters = max_iterations or self.config.max_iterations
         qual_threshold = quality_threshold or self.config.quality_threshold
 
         logger.info(
-            f"Execution #{self._execution_count}: {task.description[:50]}... "
-            f"(max_iterations={max_iters}, quality_threshold={qual_threshold})"
+            "Execution #%d: %.50s... (max_iterations=%s, quality_threshold=%s)",
+            execution_id, task.description, max_iters, qual_threshold
         )
 
         # Phase 1: Functor - Task → Prompt
@@ -248,21 +316,24 @@ class CategoricalMetaPromptingEngine:
             verify_laws
         )
 
-        # Phase 3: Execute final prompt
+        # Phase 3: Output of the final prompt. The monad already executed it
+        # to assess its quality, so only run it when no output was kept
         final_prompt = improved_prompts[-1].prompt
-        output = self._execute_prompt(final_prompt)
+        output = improved_prompts[-1].output
+        if output is None:
+            output = self._execute_prompt(final_prompt)
 
         # Phase 4: Comonad - Context Extraction
         observation = self._comonad_phase(
             output,
             final_prompt,
             improved_prompts,
+            execution_id,
             verify_laws
         )
 
         # Compute metrics
-        end_time = datetime.now()
-        latency_ms = (end_time - start_time).total_seconds() * 1000
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         # Create result
         result = CategoricalExecutionResult(
@@ -274,29 +345,106 @@ class CategoricalMetaPromptingEngine:
             observations=[observation],
             functor_laws_verified=verify_laws and self.config.verify_functor_laws,
             monad_laws_verified=verify_laws and self.config.verify_monad_laws,
-            comonad_laws_verified=verify_laws and self.config.verify_comonad_laws,
+            comonad_laws_verified=__debug__ and verify_laws and self.config.verify_comonad_laws,
             iterations=len(improved_prompts),
             total_latency_ms=latency_ms,
+            timestamp=start_time,
             metadata={
-                'execution_id': self._execution_count,
+                'execution_id': execution_id,
                 'config': self.config,
                 'timestamp': start_time.isoformat()
             }
         )
 
         # Update global metrics
-        self._total_quality_improvement += result.quality_improvement
+        with self._stats_lock:
+            self._total_quality_improvement += result.quality_improvement
+            if cache_key is not None:
+                self._result_cache[cache_key] = result
+                while len(self._result_cache) > self.config.result_cache_size:
+                    del self._result_cache[next(iter(self._result_cache))]
+
+        if self._prometheus_metrics:
+            metrics = self._prometheus_metrics
+            metrics['executions'].inc()
+            metrics['quality_improvement'].observe(result.quality_improvement)
+            metrics['latency'].observe(latency_ms)
 
         logger.info(
-            f"Execution #{self._execution_count} complete: "
-            f"quality={result.final_quality:.3f} "
-            f"(+{result.quality_improvement:.3f}), "
-            f"iterations={result.iterations}, "
-            f"latency={latency_ms:.1f}ms"
+            "Execution #%d complete: quality=%.3f (+%.3f), "
+            "iterations=%d, latency=%.1fms",
+            execution_id, result.final_quality, result.quality_improvement,
+            result.iterations, latency_ms
         )
 
         return result
 
+    async def execute_async(
+        self,
+        task: Task,
+        max_iterations: Optional[int] = None,
+        quality_threshold: Optional[float] = None,
+        verify_laws: bool = False
+    ) -> CategoricalExecutionResult:
+        """
+        Execute a task without blocking the event loop.
+
+        The monad calls the LLM client synchronously inside unit and join,
+        so the whole execution runs in a worker thread. Awaiting several of
+        these overlaps their LLM latency.
+
+        Args:
+            task: Task to execute
+            max_iterations: Override config max_iterations
+            quality_threshold: Override config quality_threshold
+            verify_laws: Verify categorical laws at runtime
+
+        Returns:
+            CategoricalExecutionResult with output, quality, and trace
+        """
+        return await asyncio.to_thread(
+            self.execute, task, max_iterations, quality_threshold, verify_laws
+        )
+
+    async def execute_batch(
+        self,
+        tasks: List[Task],
+        max_iterations: Optional[int] = None,
+        quality_threshold: Optional[float] = None,
+        verify_laws: bool = False,
+        max_concurrency: int = 8
+    ) -> List[Union[CategoricalExecutionResult, BaseException]]:
+        """
+        Execute independent tasks concurrently.
+
+        Each task runs its own functor → monad → comonad pipeline, so
+        wall-clock time approaches the slowest task rather than the sum.
+        The LLM client must tolerate concurrent calls.
+
+        Args:
+            tasks: Tasks to execute
+            max_iterations: Override config max_iterations
+            quality_threshold: Override config quality_threshold
+            verify_laws: Verify categorical laws at runtime
+            max_concurrency: Maximum executions in flight at once
+
+        Returns:
+            One entry per task, in order: a CategoricalExecutionResult, or
+            the exception that task raised
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(task: Task) -> CategoricalExecutionResult:
+            async with semaphore:
+                return await self.execute_async(
+                    task, max_iterations, quality_threshold, verify_laws
+                )
+
+        return await asyncio.gather(
+            *(run(task) for task in tasks),
+            return_exceptions=True
+        )
+
     def _functor_phase(self, task: Task, verify_laws: bool) -> Prompt:
         """
         Phase 1: Functor - Map task to initial prompt.
@@ -305,7 +453,7 @@ class CategoricalMetaPromptingEngine:
 
         Verifies identity and composition laws if requested.
         """
-        logger.debug(f"Functor phase: mapping task to prompt")
+        logger.debug("Functor phase: mapping task to prompt")
 
         # Apply functor
         prompt = self.functor.map_object(task)
@@ -313,7 +461,7 @@ class CategoricalMetaPromptingEngine:
         # Verify laws if requested
         if verify_laws and self.config.verify_functor_laws:
             identity_ok = self.functor.verify_identity_law(task)
-            logger.debug(f"Functor identity law: {'✓' if identity_ok else '✗'}")
+            logger.debug("Functor identity law: %s", '✓' if identity_ok else '✗')
 
             if not identity_ok:
                 logger.warning("Functor identity law verification failed!")
@@ -336,15 +484,17 @@ class CategoricalMetaPromptingEngine:
         Verifies monad laws if requested.
         """
         logger.debug(
-            f"Monad phase: iterative improvement "
-            f"(max_iterations={max_iterations}, quality_threshold={quality_threshold})"
+            "Monad phase: iterative improvement "
+            "(max_iterations=%s, quality_threshold=%s)",
+            max_iterations, quality_threshold
         )
 
         # Initialize with unit
         current = self.monad.unit(initial_prompt)
         prompts_history = [current]
+        plateau_steps = 0
 
-        logger.debug(f"Iteration 0: quality={current.quality.value:.3f}")
+        logger.debug("Iteration 0: quality=%.3f", current.quality.value)
 
         # Iterative improvement
         for iteration in range(1, max_iterations):
@@ -354,18 +504,22 @@ class CategoricalMetaPromptingEngine:
                 current.quality.value >= quality_threshold
             ):
                 logger.debug(
-                    f"Early stopping at iteration {iteration}: "
-                    f"quality={current.quality.value:.3f} >= {quality_threshold}"
+                    "Early stopping at iteration %d: quality=%.3f >= %s",
+                    iteration, current.quality.value, quality_threshold
                 )
                 break
 
             # Improvement function: Prompt → M(Prompt)
             def improve(p: Prompt) -> MonadPrompt:
-                # Execute current prompt
-                output = self._execute_prompt(p)
+                # Output of the current prompt, reusing the monad's run of it
+                output = current.output
+                if output is None or p is not current.prompt:
+                    output = self._execute_prompt(p)
 
-                # Create improved prompt based on output
-                improved_template = f"Refine and improve: {p.template}\n\nPrevious output:\n{output}\n\nProvide an improved solution:"
+                # Create improved prompt based on output. The previous
+                # template stays a verbatim prefix so providers with prefix
+                # (KV) caching only prefill the new suffix.
+                improved_template = f"{p.template}\n\nPrevious output:\n{output}\n\nRefine and improve the solution above:"
 
                 improved = Prompt(
                     template=improved_template,
@@ -380,12 +534,29 @@ class CategoricalMetaPromptingEngine:
             current = self.monad.bind(current, improve)
             prompts_history.append(current)
 
+            delta = current.quality.value - prompts_history[-2].quality.value
             logger.debug(
-                f"Iteration {iteration}: "
-                f"quality={current.quality.value:.3f} "
-                f"(+{current.quality.value - prompts_history[-2].quality.value:.3f})"
+                "Iteration %d: quality=%.3f (+%.3f)",
+                iteration, current.quality.value, delta
             )
 
+            # Stop once improvement has plateaued; the first refinement
+            # always gets its chance
+            if iteration >= 2 and delta < self.config.min_quality_improvement:
+                plateau_steps += 1
+            else:
+                plateau_steps = 0
+            if (
+                self.config.early_stopping and
+                self.config.plateau_patience > 0 and
+                plateau_steps >= self.config.plateau_patience
+            ):
+                logger.debug(
+                    "Early stopping at iteration %d: improvement %.3f < %s",
+                    iteration, delta, self.config.min_quality_improvement
+                )
+                break
+
         # Verify monad laws if requested
         if verify_laws and self.config.verify_monad_laws:
             # Test with simple improvement function
@@ -396,8 +567,8 @@ class CategoricalMetaPromptingEngine:
             right_id_ok = self.monad.verify_right_identity(current)
 
             logger.debug(
-                f"Monad laws: left_identity={'✓' if left_id_ok else '✗'}, "
-                f"right_identity={'✓' if right_id_ok else '✗'}"
+                "Monad laws: left_identity=%s, right_identity=%s",
+                '✓' if left_id_ok else '✗', '✓' if right_id_ok else '✗'
             )
 
         return prompts_history
@@ -407,6 +578,7 @@ class CategoricalMetaPromptingEngine:
         output: str,
         final_prompt: Prompt,
         prompts_history: List[MonadPrompt],
+        execution_id: int,
         verify_laws: bool
     ) -> Observation:
         """
@@ -421,7 +593,7 @@ class CategoricalMetaPromptingEngine:
 
         # Create observation with rich context
         observation = create_observation(
-            value=output,
+            current=output,
             context={
                 'final_prompt': final_prompt.template,
                 'quality': prompts_history[-1].quality.value,
@@ -429,20 +601,21 @@ class CategoricalMetaPromptingEngine:
                 'meta_level': final_prompt.meta_level
             },
             metadata={
-                'execution_id': self._execution_count,
+                'execution_id': execution_id,
                 'timestamp': datetime.now().isoformat(),
                 'quality_history': [p.quality.value for p in prompts_history]
             }
         )
 
-        # Verify comonad laws if requested
-        if verify_laws and self.config.verify_comonad_laws:
+        # Verify comonad laws if requested. Each check duplicates the
+        # observation again, so `python -O` strips them entirely.
+        if __debug__ and verify_laws and self.config.verify_comonad_laws:
             left_id_ok = self.comonad.verify_left_identity(observation)
             right_id_ok = self.comonad.verify_right_identity(observation)
 
             logger.debug(
-                f"Comonad laws: left_identity={'✓' if left_id_ok else '✗'}, "
-                f"right_identity={'✓' if right_id_ok else '✗'}"
+                "Comonad laws: left_identity=%s, right_identity=%s",
+                '✓' if left_id_ok else '✗', '✓' if right_id_ok else '✗'
             )
 
         return observation
@@ -476,10 +649,18 @@ class CategoricalMetaPromptingEngine:
             else 0.0
         )
 
+        prompt_cache = (
+            self.llm_client if isinstance(self.llm_client, _CachingLLMClient) else None
+        )
+
         return {
             'execution_count': self._execution_count,
             'total_quality_improvement': self._total_quality_improvement,
             'avg_quality_improvement': avg_quality_improvement,
+            'result_cache_hits': self._result_cache_hits,
+            'result_cache_size': len(self._result_cache),
+            'prompt_cache_hits': prompt_cache.hits if prompt_cache else 0,
+            'prompt_cache_misses': prompt_cache.misses if prompt_cache else 0,
             'config': {
                 'quality_threshold': self.config.quality_threshold,
                 'max_iterations': self.config.max_iterations,
@@ -489,10 +670,129 @@ class CategoricalMetaPromptingEngine:
 
     def reset_statistics(self):
         """Reset execution statistics."""
-        self._execution_count = 0
-        self._total_quality_improvement = 0.0
+        with self._stats_lock:
+            self._execution_count = 0
+            self._verify_request_count = 0
+            self._total_quality_improvement = 0.0
+            self._result_cache_hits = 0
         logger.info("Statistics reset")
 
+    def clear_result_cache(self):
+        """Forget cached execution results."""
+        with self._stats_lock:
+            self._result_cache.clear()
+
+
+def _init_prometheus() -> Optional[Dict[str, Any]]:
+    """
+    Get the engine's Prometheus metrics, creating them on first use.
+
+    Requires prometheus_client package; returns None without it.
+    """
+    global _prometheus_metrics
+
+    with _prometheus_lock:
+        if _prometheus_metrics is None:
+            try:
+                from prometheus_client import Counter, Histogram
+            except ImportError:
+                logger.warning(
+                    "prometheus_client not installed. "
+                    "Install with: pip install prometheus-client"
+                )
+                return None
+
+            _prometheus_metrics = {
+                'executions': Counter(
+                    'categorical_meta_prompting_executions_total',
+                    'Total engine executions'
+                ),
+                'quality_improvement': Histogram(
+                    'categorical_meta_prompting_quality_improvement',
+                    'Quality improvement per execution',
+                    buckets=[-0.1, 0.0, 0.05, 0.1, 0.2, 0.3, 0.5]
+                ),
+                'latency': Histogram(
+                    'categorical_meta_prompting_latency_ms',
+                    'Execution latency in milliseconds',
+                    buckets=[10, 50, 100, 500, 1000, 5000, 10000, 30000, 60000]
+                ),
+            }
+
+            logger.info("Prometheus metrics initialized")
+
+        return _prometheus_metrics
+
+
+class _CachingLLMClient:
+    """
+    LLM client wrapper that memoizes complete() by prompt text.
+
+    The engine, functor and monad all share one wrapper, so the monad's
+    unit/join calls are cached as well as _execute_prompt. Keys are
+    BLAKE2b digests, so long prompts are not kept alive by the cache.
+    """
+
+    def __init__(self, client: Any, maxsize: int):
+        self.client = client
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._outputs: Dict[bytes, str] = {}  # least recently used first
+        self._lock = threading.Lock()
+
+    def complete(self, prompt: str) -> str:
+        key = blake2b(prompt.encode(), digest_size=16).digest()
+        with self._lock:
+            output = self._outputs.pop(key, None)
+            if output is not None:
+                # Move to the end: most recently used
+                self._outputs[key] = output
+                self.hits += 1
+                return output
+            self.misses += 1
+
+        output = self.client.complete(prompt)
+
+        with self._lock:
+            self._outputs[key] = output
+            while len(self._outputs) > self.maxsize:
+                del self._outputs[next(iter(self._outputs))]
+        return output
+
+    def __getattr__(self, name: str) -> Any:
+        # copy/pickle look up attributes before __init__ has set client;
+        # without this guard self.client would recurse back in here
+        if name == 'client':
+            raise AttributeError(name)
+        # Anything else (model name, usage counters, ...) is the client's
+        return getattr(self.client, name)
+
+
+def _result_cache_key(
+    task: Task,
+    max_iterations: Optional[int],
+    quality_threshold: Optional[float],
+    verify_laws: bool
+) -> Tuple:
+    """
+    Key identifying an execution for the result cache.
+
+    Covers every task field the pipeline reads plus the per-call overrides.
+    Lists and dicts are keyed by repr, since they are not hashable.
+    """
+    return (
+        task.description,
+        task.type,
+        task.complexity,
+        repr(task.examples),
+        repr(task.constraints),
+        repr(sorted(task.metadata.items())),
+        max_iterations,
+        quality_threshold,
+        verify_laws,
+    )
+
 
 def create_categorical_engine(
     llm_client: Any,
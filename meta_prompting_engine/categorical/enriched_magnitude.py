@@ -42,6 +42,12 @@ from typing import List, Callable, Optional, Tuple, Dict, Any
 from dataclasses import dataclass, field
 import math
 from functools import lru_cache
+from operator import itemgetter, mul
+
+try:
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+except ImportError:  # Optional: falls back to the pure-Python DP
+    _rf_levenshtein = None
 
 
 @dataclass
@@ -63,6 +69,11 @@ class MagnitudeResult:
     diversity_score: float
     redundancy_pairs: List[Tuple[int, int, float]]
     interpretation: str
+    # Cholesky factor of Z, set by EnrichedMagnitude so compute_incremental
+    # can extend it
+    _cholesky: Optional[List[List[float]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __str__(self) -> str:
         return f"Magnitude({self.value:.3f}, diversity={self.diversity_score:.2%})"
@@ -129,7 +140,7 @@ class EnrichedMagnitude:
             )
 
         if n == 1:
-            return MagnitudeResult(
+            result = MagnitudeResult(
                 value=1.0,
                 weights=[1.0],
                 similarity_matrix=[[1.0]],
@@ -137,15 +148,20 @@ class EnrichedMagnitude:
                 redundancy_pairs=[],
                 interpretation="Single item has magnitude 1"
             )
-
-        # Step 1: Compute distance matrix
-        D = self._compute_distance_matrix(items)
-
-        # Step 2: Compute similarity matrix Z = exp(-scale * D)
-        Z = [[math.exp(-self.scale * D[i][j]) for j in range(n)] for i in range(n)]
-
-        # Step 3: Solve Z·w = 1 using Gaussian elimination
-        weights = self._solve_linear_system(Z)
+            result._cholesky = [[math.sqrt(1.0 + self.regularization)]]
+            return result
+
+        # Steps 1-2: Similarity matrix Z = exp(-scale * D), one pass over
+        # the pairs without materializing D
+        Z = self._compute_similarity_matrix(items)
+
+        # Step 3: Solve Z·w = 1. Z is symmetric and usually positive
+        # definite, so try Cholesky (half the work of elimination) first
+        factor = self._cholesky_factor(Z)
+        if factor is not None:
+            weights = self._cholesky_solve(factor)
+        else:
+            weights = self._solve_linear_system(Z)
 
         # Step 4: Magnitude = sum(w)
         magnitude = sum(weights)
@@ -159,7 +175,7 @@ class EnrichedMagnitude:
         # Generate interpretation
         interpretation = self._interpret_magnitude(magnitude, n, diversity_score)
 
-        return MagnitudeResult(
+        result = MagnitudeResult(
             value=magnitude,
             weights=weights,
             similarity_matrix=Z if return_details else [],
@@ -167,6 +183,8 @@ class EnrichedMagnitude:
             redundancy_pairs=redundancy_pairs,
             interpretation=interpretation
         )
+        result._cholesky = factor
+        return result
 
     def compute_incremental(
         self,
@@ -177,7 +195,10 @@ class EnrichedMagnitude:
         """
         Incrementally update magnitude when adding a new item.
 
-        More efficient than recomputing from scratch.
+        Adding an item borders Z with one row and column, so the cached
+        Cholesky factor grows by one row in O(n²) instead of refactoring
+        Z in O(n³). Falls back to a full recompute when there is no factor
+        or the bordered Z is not positive definite.
 
         Args:
             existing: Previous magnitude result
@@ -187,9 +208,48 @@ class EnrichedMagnitude:
         Returns:
             Updated MagnitudeResult
         """
-        # For now, just recompute (optimization: use matrix update formulas)
         all_items = existing_items + [new_item]
-        return self.compute(all_items)
+        factor = existing._cholesky
+        if factor is None or not existing_items or len(factor) != len(existing_items):
+            return self.compute(all_items)
+
+        # New column of Z: similarities to the existing items
+        prepared, distance_fn = self._prepare_items(all_items)
+        new_prepared = prepared.pop()
+        z = [math.exp(-self.scale * distance_fn(item, new_prepared)) for item in prepared]
+
+        # Border the factor: L·l = z, d = sqrt(1 + reg - l·l)
+        new_row: List[float] = []
+        for z_j, L_j in zip(z, factor):
+            new_row.append((z_j - sum(map(mul, new_row, L_j))) / L_j[-1])
+        pivot = 1.0 + self.regularization - sum(map(mul, new_row, new_row))
+        if pivot < 1e-12:
+            return self.compute(all_items)
+        new_row.append(math.sqrt(pivot))
+        factor = factor + [new_row]
+
+        weights = self._cholesky_solve(factor)
+        magnitude = sum(weights)
+        n = len(all_items)
+        diversity_score = magnitude / n
+
+        # Existing pairs are unchanged; same tie order as a full recompute
+        n_old = n - 1
+        redundancy_pairs = existing.redundancy_pairs + [
+            (i, n_old, z_i) for i, z_i in enumerate(z) if z_i > 0.8
+        ]
+        redundancy_pairs.sort(key=lambda x: (-x[2], x[0], x[1]))
+
+        result = MagnitudeResult(
+            value=magnitude,
+            weights=weights,
+            similarity_matrix=[],
+            diversity_score=diversity_score,
+            redundancy_pairs=redundancy_pairs,
+            interpretation=self._interpret_magnitude(magnitude, n, diversity_score)
+        )
+        result._cholesky = factor
+        return result
 
     def diversity_contribution(
         self,
@@ -210,7 +270,7 @@ class EnrichedMagnitude:
             return 1.0
 
         current = self.compute(existing_items)
-        with_new = self.compute(existing_items + [item])
+        with_new = self.compute_incremental(current, item, existing_items)
 
         return with_new.value - current.value
 
@@ -225,6 +285,12 @@ class EnrichedMagnitude:
         Uses greedy algorithm: iteratively add item that
         increases magnitude the most.
 
+        With L the Cholesky factor of the selection's Z and L·y = 1,
+        adding x raises the magnitude by (1 - l·y)² / (1 + reg - l·l)
+        where L·l = z is x's column of Z. Each candidate keeps its l and
+        extends it by one entry per step, so a step costs O(n·k) rather
+        than two full magnitude computations per candidate.
+
         Args:
             items: Full item set
             k: Number of items to select
@@ -235,37 +301,91 @@ class EnrichedMagnitude:
         if k >= len(items):
             return items, self.compute(items)
 
-        selected = []
-        remaining = list(items)
+        prepared, distance_fn = self._prepare_items(items)
+        selected: List[str] = []
+        remaining = list(range(len(items)))
+
+        factor: Optional[List[List[float]]] = []
+        y: List[float] = []
+        columns: Dict[int, List[float]] = {i: [] for i in remaining}
 
         for _ in range(k):
-            best_item = None
+            best_pos = 0
             best_contribution = -float('inf')
-
-            for item in remaining:
-                contribution = self.diversity_contribution(item, selected)
+            best_pivot = 0.0
+
+            for pos, i in enumerate(remaining):
+                pivot = 0.0
+                if factor is not None:
+                    l = columns[i]
+                    pivot = 1.0 + self.regularization - sum(map(mul, l, l))
+                if pivot >= 1e-12:
+                    contribution = (1.0 - sum(map(mul, l, y))) ** 2 / pivot
+                else:
+                    # Not positive definite: fall back to direct computation
+                    contribution = self.diversity_contribution(items[i], selected)
                 if contribution > best_contribution:
                     best_contribution = contribution
-                    best_item = item
-
-            if best_item:
-                selected.append(best_item)
-                remaining.remove(best_item)
+                    best_pos = pos
+                    best_pivot = pivot
+
+            best = remaining.pop(best_pos)
+            selected.append(items[best])
+
+            if best_pivot < 1e-12:
+                factor = None
+                continue
+
+            # Border the factor with the chosen item's row
+            d = math.sqrt(best_pivot)
+            new_row = columns.pop(best) + [d]
+            factor.append(new_row)
+            y.append((1.0 - sum(map(mul, new_row, y))) / d)
+            for i in remaining:
+                l = columns[i]
+                z = math.exp(-self.scale * distance_fn(prepared[best], prepared[i]))
+                l.append((z - sum(map(mul, l, new_row))) / d)
 
         return selected, self.compute(selected)
 
-    def _compute_distance_matrix(self, items: List[str]) -> List[List[float]]:
-        """Compute pairwise distance matrix."""
+    def _prepare_items(self, items: List[str]) -> Tuple[List[Any], Callable[[Any, Any], float]]:
+        """
+        Preprocess items for repeated distance evaluation.
+
+        Set-based distances build each item's set once, not once per pair,
+        and encode it as a bitmask over the items' shared vocabulary.
+
+        Returns:
+            (prepared_items, distance function over prepared items)
+        """
+        prepare = _PREPARED_DISTANCES.get(self.distance_fn)
+        if prepare is None:
+            return list(items), self.distance_fn
+        return _to_bitsets([prepare(item) for item in items]), _bitset_jaccard_distance
+
+    def _compute_similarity_matrix(self, items: List[str]) -> List[List[float]]:
+        """
+        Compute Z = exp(-scale * D) directly from the items.
+
+        Each pair's distance is exponentiated as soon as it is computed,
+        so D is never stored. D is symmetric with a zero diagonal, so each
+        pair is evaluated once and the diagonal is exactly 1. Regularization
+        is applied by the solvers, not stored in Z.
+        """
         n = len(items)
-        D = [[0.0] * n for _ in range(n)]
+        Z = [[1.0] * n for _ in range(n)]
+        items, distance_fn = self._prepare_items(items)
+        neg_scale = -self.scale
+        exp = math.exp
 
         for i in range(n):
+            item_i, Z_i = items[i], Z[i]
             for j in range(i + 1, n):
-                d = self.distance_fn(items[i], items[j])
-                D[i][j] = d
-                D[j][i] = d
+                z = exp(neg_scale * distance_fn(item_i, items[j]))
+                Z_i[j] = z
+                Z[j][i] = z
 
-        return D
+        return Z
 
     def _solve_linear_system(self, Z: List[List[float]]) -> List[float]:
         """
@@ -318,21 +438,67 @@ class EnrichedMagnitude:
 
         return w
 
-    def _find_redundancy_pairs(
-        self,
-        Z: List[List[float]],
-        threshold: float = 0.8
-    ) -> List[Tuple[int, int, float]]:
-        """Find pairs with similarity above threshold."""
-        pairs = []
+    def _cholesky_factor(self, Z: List[List[float]]) -> Optional[List[List[float]]]:
+        """
+        Factor Z + reg·I = L·Lᵀ.
+
+        Returns:
+            Lower-triangular L as ragged rows, or None if Z is not
+            positive definite
+        """
         n = len(Z)
+        L: List[List[float]] = []  # Row i holds L[i][0..i]
 
         for i in range(n):
+            row = Z[i]
+            L_i: List[float] = []
+            for j in range(i):
+                L_j = L[j]
+                L_i.append((row[j] - sum(map(mul, L_i, L_j))) / L_j[j])
+
+            pivot = row[i] + self.regularization - sum(map(mul, L_i, L_i))
+            if pivot < 1e-12:
+                return None
+            L_i.append(math.sqrt(pivot))
+            L.append(L_i)
+
+        return L
+
+    def _cholesky_solve(self, L: List[List[float]]) -> List[float]:
+        """Solve L·Lᵀ·w = 1 by forward and back substitution."""
+        n = len(L)
+
+        # Forward substitution: L·y = 1
+        y: List[float] = []
+        for L_i in L:
+            y.append((1.0 - sum(map(mul, L_i, y))) / L_i[-1])
+
+        # Back substitution: Lᵀ·w = y
+        w = [0.0] * n
+        for i in range(n - 1, -1, -1):
+            total = y[i]
             for j in range(i + 1, n):
-                if Z[i][j] > threshold:
-                    pairs.append((i, j, Z[i][j]))
+                total -= L[j][i] * w[j]
+            w[i] = total / L[i][i]
+
+        return w
 
-        return sorted(pairs, key=lambda x: -x[2])
+    def _find_redundancy_pairs(
+        self,
+        Z: List[List[float]],
+        threshold: float = 0.8
+    ) -> List[Tuple[int, int, float]]:
+        """Find pairs with similarity above threshold, most similar first."""
+        pairs = [
+            (i, j, z)
+            for i, Z_i in enumerate(Z)
+            for j, z in enumerate(Z_i[i + 1:], i + 1)
+            if z > threshold
+        ]
+
+        # Stable, so ties keep (i, j) order
+        pairs.sort(key=itemgetter(2), reverse=True)
+        return pairs
 
     def _interpret_magnitude(
         self,
@@ -394,26 +560,56 @@ class EnrichedMagnitude:
         return -math.log(1 - normalized + 1e-10)
 
     @staticmethod
-    @lru_cache(maxsize=1000)
     def _levenshtein(a: str, b: str) -> int:
-        """Compute Levenshtein edit distance (cached)."""
-        if len(a) < len(b):
-            return EnrichedMagnitude._levenshtein(b, a)
+        """Compute Levenshtein edit distance (rapidfuzz if installed)."""
+        if _rf_levenshtein is not None:
+            return _rf_levenshtein.distance(a, b)
+        # Symmetric, so cache each unordered pair under one key
+        if (len(a), a) < (len(b), b):
+            a, b = b, a
+        return _levenshtein_py(a, b)
 
-        if len(b) == 0:
-            return len(a)
 
-        previous_row = range(len(b) + 1)
-        for i, c1 in enumerate(a):
-            current_row = [i + 1]
-            for j, c2 in enumerate(b):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
+@lru_cache(maxsize=16384)
+def _levenshtein_py(a: str, b: str) -> int:
+    """
+    Pure-Python Levenshtein edit distance (cached), len(a) >= len(b).
 
-        return previous_row[-1]
+    Myers' bit-parallel algorithm: column i of the DP over b is kept as
+    vertical +1/-1 delta bitmasks (Pv, Mv), so each character of a costs
+    a handful of int operations instead of a len(b) row loop. Python ints
+    are arbitrary-width, so there is no 64-character limit.
+    """
+    m = len(b)
+    if m == 0:
+        return len(a)
+
+    # Match masks: bit j of peq[c] is set iff b[j] == c
+    peq: Dict[str, int] = {}
+    bit = 1
+    for c in b:
+        peq[c] = peq.get(c, 0) | bit
+        bit <<= 1
+    mask = bit - 1
+    last = bit >> 1
+
+    pv, mv, score = mask, 0, m
+    for c in a:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+
+    return score
 
 
 # === Semantic Distance Functions ===
@@ -431,21 +627,7 @@ def cosine_distance(a: str, b: str) -> float:
     Returns:
         Distance in [0, ∞)
     """
-    words_a = set(a.lower().split())
-    words_b = set(b.lower().split())
-
-    if not words_a or not words_b:
-        return 10.0  # Maximum distance
-
-    intersection = len(words_a & words_b)
-    union = len(words_a | words_b)
-
-    jaccard = intersection / union if union > 0 else 0
-
-    # Convert similarity [0,1] to distance [0, ∞)
-    if jaccard >= 1.0:
-        return 0.0
-    return -math.log(jaccard + 1e-10)
+    return _jaccard_distance(_word_set(a), _word_set(b))
 
 
 def ngram_distance(a: str, b: str, n: int = 3) -> float:
@@ -459,26 +641,71 @@ def ngram_distance(a: str, b: str, n: int = 3) -> float:
     Returns:
         Distance in [0, ∞)
     """
-    def get_ngrams(s: str, n: int) -> set:
-        s = s.lower()
-        return set(s[i:i+n] for i in range(max(0, len(s) - n + 1)))
+    return _jaccard_distance(_ngram_set(a, n), _ngram_set(b, n))
+
+
+def _word_set(s: str) -> frozenset:
+    """Lowercased words of s."""
+    return frozenset(s.lower().split())
+
+
+def _ngram_set(s: str, n: int = 3) -> frozenset:
+    """Lowercased character n-grams of s."""
+    s = s.lower()
+    return frozenset(s[i:i+n] for i in range(max(0, len(s) - n + 1)))
 
-    ngrams_a = get_ngrams(a, n)
-    ngrams_b = get_ngrams(b, n)
 
-    if not ngrams_a or not ngrams_b:
-        return 10.0
+def _jaccard_distance(set_a: frozenset, set_b: frozenset) -> float:
+    """Jaccard similarity of two sets mapped to a distance in [0, ∞)."""
+    if not set_a or not set_b:
+        return 10.0  # Maximum distance
 
-    intersection = len(ngrams_a & ngrams_b)
-    union = len(ngrams_a | ngrams_b)
+    intersection = len(set_a & set_b)
+    union = len(set_a) + len(set_b) - intersection
 
     jaccard = intersection / union if union > 0 else 0
 
+    # Convert similarity [0,1] to distance [0, ∞)
     if jaccard >= 1.0:
         return 0.0
     return -math.log(jaccard + 1e-10)
 
 
+def _to_bitsets(sets: List[frozenset]) -> List[Tuple[int, int]]:
+    """Encode sets as (bitmask, size) pairs over a shared vocabulary."""
+    vocab: Dict[str, int] = {}
+    encoded = []
+    for tokens in sets:
+        bits = 0
+        for token in tokens:
+            bits |= 1 << vocab.setdefault(token, len(vocab))
+        encoded.append((bits, len(tokens)))
+    return encoded
+
+
+def _bitset_jaccard_distance(a: Tuple[int, int], b: Tuple[int, int]) -> float:
+    """_jaccard_distance over (bitmask, size) encodings from _to_bitsets."""
+    bits_a, size_a = a
+    bits_b, size_b = b
+    if not size_a or not size_b:
+        return 10.0  # Maximum distance
+
+    intersection = (bits_a & bits_b).bit_count()
+    jaccard = intersection / (size_a + size_b - intersection)
+
+    if jaccard >= 1.0:
+        return 0.0
+    return -math.log(jaccard + 1e-10)
+
+
+# Distance functions that are a Jaccard distance over a per-item set,
+# mapped to the function building that set
+_PREPARED_DISTANCES: Dict[Callable[[str, str], float], Callable[[str], frozenset]] = {
+    cosine_distance: _word_set,
+    ngram_distance: _ngram_set,
+}
+
+
 # === Factory Functions ===
 
 def create_magnitude_computer(
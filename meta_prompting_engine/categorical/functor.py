@@ -27,9 +27,8 @@ Example:
     >>> assert functor.verify_composition_law(task, f, g)
 """
 
-from typing import TypeVar, Callable, Generic, Any
+from typing import TypeVar, Callable, Generic, Any, Dict, List, Optional, Sequence
 from dataclasses import dataclass
-import hashlib
 
 # Type variables for categories
 T = TypeVar('T')  # Tasks category
@@ -44,6 +43,8 @@ class Functor(Generic[T, P]):
     Attributes:
         map_object: F_obj : T → P (maps objects)
         map_morphism: F_mor : (T → T) → (P → P) (maps morphisms)
+        map_object_batch: Optional F_obj over a sequence of objects; must
+            agree with map_object element-wise
 
     Laws:
         1. Identity: F(id) = id
@@ -60,6 +61,7 @@ class Functor(Generic[T, P]):
 
     map_object: Callable[[T], P]
     map_morphism: Callable[[Callable[[T], T]], Callable[[P], P]]
+    map_object_batch: Optional[Callable[[Sequence[T]], List[P]]] = None
 
     def __call__(self, task: T) -> P:
         """
@@ -79,6 +81,26 @@ class Functor(Generic[T, P]):
         """
         return self.map_object(task)
 
+    def map_objects(self, tasks: Sequence[T]) -> List[P]:
+        """
+        Apply functor to many tasks (batched object mapping).
+
+        Equivalent to [F(task) for task in tasks], so the functor laws
+        hold element-wise. Uses map_object_batch when provided.
+
+        Args:
+            tasks: Input tasks of type T
+
+        Returns:
+            One prompt per task, in order
+
+        Example:
+            >>> prompts = functor.map_objects([task_a, task_b])
+        """
+        if self.map_object_batch is not None:
+            return self.map_object_batch(tasks)
+        return [self.map_object(task) for task in tasks]
+
     def fmap(self, f: Callable[[T], T]) -> Callable[[P], P]:
         """
         Apply functor to morphism (morphism mapping).
@@ -173,7 +195,7 @@ class Functor(Generic[T, P]):
         """
         Check if two prompts are equal (structural equality).
 
-        Uses hash-based comparison for efficiency. Override for custom equality.
+        Compares the prompts' string forms. Override for custom equality.
 
         Args:
             p1: First prompt
@@ -182,20 +204,7 @@ class Functor(Generic[T, P]):
         Returns:
             True if prompts are structurally equal
         """
-        return self._hash_prompt(p1) == self._hash_prompt(p2)
-
-    def _hash_prompt(self, prompt: P) -> str:
-        """
-        Compute hash of prompt for equality checking.
-
-        Args:
-            prompt: Prompt to hash
-
-        Returns:
-            SHA-256 hash as hex string
-        """
-        prompt_str = str(prompt)
-        return hashlib.sha256(prompt_str.encode()).hexdigest()
+        return str(p1) == str(p2)
 
 
 # Factory function for creating Task → Prompt functor
@@ -231,10 +240,26 @@ def create_task_to_prompt_functor(llm_client) -> Functor:
         >>> print(prompt.template)
         "You are an expert problem solver..."
     """
-    from .types import Task, Prompt
-    from .complexity import analyze_complexity
+    from .types import Task, Prompt, Strategy
+    from .complexity import analyze_complexity, analyze_complexity_batch
     from .strategy import select_strategy
 
+    def build_prompt(task: Task, complexity_score: float, strategy: Strategy) -> Prompt:
+        """Build the prompt for an analyzed task."""
+        context = {
+            'complexity': complexity_score,
+            'strategy': strategy.name,
+            'task_type': task.type,
+            'metadata': task.metadata
+        }
+
+        return Prompt(
+            template=strategy.template,
+            variables=extract_variables(task),
+            context=context,
+            meta_level=0
+        )
+
     def map_object(task: Task) -> Prompt:
         """
         F_obj: Map task to prompt.
@@ -257,21 +282,29 @@ def create_task_to_prompt_functor(llm_client) -> Functor:
         # Select strategy
         strategy = select_strategy(complexity.overall)
 
-        # Build context
-        context = {
-            'complexity': complexity.overall,
-            'strategy': strategy.name,
-            'task_type': task.type,
-            'metadata': task.metadata
-        }
+        # Build context and generate prompt
+        return build_prompt(task, complexity.overall, strategy)
 
-        # Generate prompt
-        return Prompt(
-            template=strategy.template,
-            variables=extract_variables(task),
-            context=context,
-            meta_level=0
-        )
+    def map_objects(tasks: Sequence[Task]) -> List[Prompt]:
+        """
+        F_obj over many tasks, equal to [map_object(t) for t in tasks].
+
+        Complexity goes through analyze_complexity_batch, and a strategy
+        is selected once per distinct complexity score rather than once
+        per task. Prompts only read the strategy's name and template, so
+        sharing it is safe.
+        """
+        strategies: Dict[float, Strategy] = {}
+        prompts = []
+
+        for task, complexity in zip(tasks, analyze_complexity_batch(tasks)):
+            score = complexity.overall
+            strategy = strategies.get(score)
+            if strategy is None:
+                strategy = strategies[score] = select_strategy(score)
+            prompts.append(build_prompt(task, score, strategy))
+
+        return prompts
 
     def map_morphism(f: Callable[[Task], Task]) -> Callable[[Prompt], Prompt]:
         """
@@ -302,7 +335,8 @@ def create_task_to_prompt_functor(llm_client) -> Functor:
 
     return Functor(
         map_object=map_object,
-        map_morphism=map_morphism
+        map_morphism=map_morphism,
+        map_object_batch=map_objects
     )
 
 
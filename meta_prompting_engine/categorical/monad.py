@@ -37,7 +37,6 @@ Example:
 from typing import TypeVar, Callable, Generic, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
-import hashlib
 
 from .types import Prompt, QualityScore
 
@@ -62,6 +61,7 @@ class MonadPrompt:
         meta_level: Recursion depth (0 = initial, 1+ = improved)
         history: List of previous prompts in improvement chain
         timestamp: When this prompt was generated
+        output: LLM output the quality was assessed on (None if not executed)
 
     Example:
         >>> mp = MonadPrompt(
@@ -75,6 +75,7 @@ class MonadPrompt:
     meta_level: int = 0
     history: list[Prompt] = field(default_factory=list)
     timestamp: Optional[datetime] = None
+    output: Optional[str] = None
 
     def __post_init__(self):
         """Set timestamp if not provided."""
@@ -264,24 +265,12 @@ class Monad(Generic[A]):
             True if structurally equal
         """
         return (
-            self._hash_prompt(mp1.prompt) == self._hash_prompt(mp2.prompt) and
+            mp1.prompt.template == mp2.prompt.template and
+            mp1.prompt.meta_level == mp2.prompt.meta_level and
             abs(mp1.quality.value - mp2.quality.value) < 0.01 and
             mp1.meta_level == mp2.meta_level
         )
 
-    def _hash_prompt(self, prompt: Prompt) -> str:
-        """
-        Compute hash of prompt for equality checking.
-
-        Args:
-            prompt: Prompt to hash
-
-        Returns:
-            SHA-256 hash as hex string
-        """
-        prompt_str = f"{prompt.template}_{prompt.meta_level}"
-        return hashlib.sha256(prompt_str.encode()).hexdigest()
-
 
 # Factory function for creating Recursive Meta-Prompting Monad
 def create_recursive_meta_monad(
@@ -352,7 +341,8 @@ def create_recursive_meta_monad(
             quality=quality,
             meta_level=0,
             history=[],
-            timestamp=datetime.now()
+            timestamp=datetime.now(),
+            output=output
         )
 
     def join(nested: MonadPrompt) -> MonadPrompt:
@@ -396,7 +386,8 @@ def create_recursive_meta_monad(
             quality=new_quality,
             meta_level=nested.meta_level,
             history=nested.history,
-            timestamp=datetime.now()
+            timestamp=datetime.now(),
+            output=new_output
         )
 
     return Monad(unit=unit, join=join)
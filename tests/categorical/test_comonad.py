@@ -12,6 +12,7 @@ References:
 - CC2.0 OBSERVE framework integration
 """
 
+import json
 import pytest
 from hypothesis import given, strategies as st, settings, assume
 from typing import Callable, Any
@@ -19,9 +20,12 @@ from datetime import datetime
 
 from meta_prompting_engine.categorical.comonad import (
     Comonad,
+    ContextComonad,
     Observation,
     create_context_comonad,
-    create_observation
+    create_observation,
+    _assess_observation_quality,
+    _assess_observation_completeness
 )
 
 
@@ -312,6 +316,34 @@ class TestComonadExtend:
             "extend(extract) should be identity"
 
 
+    def test_extend_applies_f_to_observation_directly(self, comonad: Comonad):
+        """
+        Test that extend passes the observation itself to f.
+
+        By left identity the inner layer of duplicate(wa) is wa, so
+        extend skips building the meta-observation.
+        """
+        obs = create_observation("result", {"quality": 0.9})
+        calls = []
+        counting = Comonad(
+            extract=comonad.extract,
+            duplicate=lambda w: calls.append(w) or comonad.duplicate(w)
+        )
+
+        result = counting.extend(lambda w: w, obs)
+
+        assert result.current is obs
+        assert calls == []
+
+    def test_observations_equal_uses_value_equality(self, comonad: Comonad):
+        """Test that equality compares values, not their string forms."""
+        assert comonad._observations_equal(1, 1.0)
+        assert not comonad._observations_equal(1, "1")
+        assert comonad._observations_equal(
+            create_observation([1, 2], {"quality": 0.9}),
+            create_observation([1, 2], {"quality": 0.5})
+        )
+
 class TestComonadImplementation:
     """
     Additional tests for comonad implementation details.
@@ -352,6 +384,19 @@ class TestComonadImplementation:
         assert 0.0 <= completeness <= 1.0, \
             "Observation completeness should be in [0.0, 1.0]"
 
+    def test_meta_observation_metadata_is_a_dict(self, comonad: Comonad):
+        """Meta-observation metadata is a writable, serializable dict."""
+        obs = create_observation("result", {"prompt": "p"})
+        metadata = comonad.duplicate(obs).metadata
+        metadata['reviewed'] = True
+
+        assert isinstance(metadata, dict)
+        assert json.loads(json.dumps(metadata)) == {
+            'observation_quality': _assess_observation_quality(obs),
+            'completeness': _assess_observation_completeness(obs),
+            'reviewed': True
+        }
+
     @settings(max_examples=100, deadline=None)
     @given(obs=observation_strategy())
     def test_history_accumulation(self, comonad: Comonad, obs: Observation):
@@ -366,6 +411,51 @@ class TestComonadImplementation:
         assert duplicated.history[0] == obs, \
             "duplicate should add current observation to history"
 
+    def test_history_is_a_list_built_on_read(self, comonad: Comonad):
+        """Nested duplicates share history until it is read as a list."""
+        obs = create_observation("result", {"quality": 0.9}, history=[])
+        meta = comonad.duplicate(comonad.duplicate(obs))
+
+        assert meta.history_len == 2
+        assert not isinstance(meta._history, list)
+
+        history = meta.history
+        assert isinstance(history, list)
+        assert history == [meta.current, obs]
+        assert meta.history is history
+
+        # A read history is an ordinary list; later duplicates snapshot it
+        history.append(obs)
+        assert meta.history_len == 3
+        assert comonad.duplicate(meta).history == [meta, meta.current, obs, obs]
+
+    def test_to_dict_matches_public_fields(self, comonad: Comonad):
+        """to_dict gives the asdict-style view: public fields, nested observations as dicts."""
+        prev = create_observation("prev", {"quality": 0.5})
+        obs = create_observation("result", {"quality": 0.9}, history=[prev], metadata={"tags": ["a"]})
+
+        data = obs.to_dict()
+
+        assert data == {
+            'current': "result",
+            'context': {"quality": 0.9},
+            'history': [prev.to_dict()],
+            'metadata': {"tags": ["a"]},
+            'timestamp': obs.timestamp,
+        }
+        assert data['history'][0]['history'] == []
+        assert data['metadata']['tags'] is not obs.metadata['tags']
+        assert comonad.duplicate(obs).to_dict()['current'] == data
+
+    def test_original_context_keys_is_snapshot(self, comonad: Comonad):
+        """Context keys are recorded as of duplication."""
+        obs = create_observation("result", {"prompt": "p", "quality": 0.9})
+        meta = comonad.duplicate(obs)
+        obs.context['meta_level'] = 1
+
+        assert meta.context['original_context_keys'] == ['prompt', 'quality']
+        assert json.loads(json.dumps(meta.context['original_context_keys'])) == ['prompt', 'quality']
+
     @settings(max_examples=100, deadline=None)
     @given(obs=observation_strategy())
     def test_meta_observation_context(self, comonad: Comonad, obs: Observation):
@@ -386,6 +476,16 @@ class TestComonadImplementation:
             "duplicate should record history depth"
 
 
+    def test_factory_returns_context_comonad(self):
+        """Test that the factory builds the class-level context comonad."""
+        comonad = create_context_comonad()
+        obs = create_observation("result", {"quality": 0.9})
+
+        assert isinstance(comonad, ContextComonad)
+        assert isinstance(comonad, Comonad)
+        assert comonad.extract is ContextComonad.extract
+        assert comonad.duplicate(obs).current is obs
+
 class TestCC2ObserveIntegration:
     """
     Tests for CC2.0 OBSERVE framework integration.
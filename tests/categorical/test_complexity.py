@@ -0,0 +1,124 @@
+"""
+Tests for task complexity analysis.
+
+Tests verify:
+1. Dimension scores for representative tasks
+2. Result caching keyed on the fields the analysis reads
+3. Cached results are not shared between callers
+4. Batch analysis
+"""
+
+import pytest
+
+from meta_prompting_engine.categorical.types import Task, ComplexityAnalysis
+from meta_prompting_engine.categorical.complexity import (
+    analyze_complexity, analyze_complexity_batch, ComplexityDimensions, DIMENSION_WEIGHTS
+)
+
+
+class TestDimensions:
+    """Tests for individual complexity dimensions."""
+
+    def test_algorithmic_high_keywords(self):
+        """High complexity keywords dominate the algorithmic score."""
+        analysis = analyze_complexity(Task("Optimize this recursive algorithm"))
+        assert analysis.dimensions['algorithmic'] == pytest.approx(1.0)
+
+    def test_algorithmic_counts_substrings(self):
+        """Keywords match as substrings: 'maximum' also contains 'max'."""
+        analysis = analyze_complexity(Task("get the first maximum"))
+        # 'maximum' is a high keyword, so it wins over get/first/max
+        assert analysis.dimensions['algorithmic'] == pytest.approx(0.8 + 0.2 / 3)
+
+    def test_algorithmic_default(self):
+        """No keywords gives the default score."""
+        analysis = analyze_complexity(Task("Write a poem"))
+        assert analysis.dimensions['algorithmic'] == 0.5
+
+    def test_domain_from_task_type(self):
+        """Domain complexity is read from the task type."""
+        assert analyze_complexity(Task("x", type="Quantum")).dimensions['domain'] == 0.8
+        assert analyze_complexity(Task("x", type="coding")).dimensions['domain'] == 0.4
+        assert analyze_complexity(Task("x", type="general")).dimensions['domain'] == 0.2
+
+    def test_ambiguity_examples_and_constraints(self):
+        """Examples and constraints reduce ambiguity."""
+        both = Task("x", examples=[{"in": "1"}], constraints=["fast"])
+        one = Task("x", constraints=["fast"])
+        vague = Task("maybe do something")
+        questions = Task("what? why? how?")
+        assert analyze_complexity(both).dimensions['ambiguity'] == 0.2
+        assert analyze_complexity(one).dimensions['ambiguity'] == 0.5
+        assert analyze_complexity(vague).dimensions['ambiguity'] == 0.9
+        assert analyze_complexity(questions).dimensions['ambiguity'] == 0.7
+
+    @pytest.mark.parametrize("description,expected", [
+        ("process a stream of events", 0.9),
+        ("sort 2000000 rows", 0.9),
+        ("sort 20000 rows", 0.6),
+        ("sort 2000 rows", 0.3),
+        ("sort 20 rows", 0.2),
+    ])
+    def test_scale(self, description, expected):
+        """Scale comes from keywords or the largest number mentioned."""
+        assert analyze_complexity(Task(description)).dimensions['scale'] == expected
+
+    def test_overall_is_weighted_average(self):
+        """Overall score is the weighted sum of the dimensions."""
+        analysis = analyze_complexity(Task("Find maximum in [3,1,4,1,5,9]"))
+        d = analysis.dimensions
+        expected = (0.4 * d['algorithmic'] + 0.3 * d['domain']
+                    + 0.2 * d['ambiguity'] + 0.1 * d['scale'])
+        assert analysis.overall == pytest.approx(expected)
+        assert isinstance(analysis, ComplexityAnalysis)
+
+    def test_dimension_names_and_weights(self):
+        """Dimensions are reported by name and the weights sum to 1."""
+        analysis = analyze_complexity(Task("Write a poem"))
+        assert list(analysis.dimensions) == list(ComplexityDimensions._fields)
+        assert sum(DIMENSION_WEIGHTS) == pytest.approx(1.0)
+
+
+class TestCaching:
+    """Tests for analysis result caching."""
+
+    def test_repeated_analysis_is_equal(self):
+        """Analyzing the same task twice gives the same result."""
+        task = Task("Implement binary search", type="coding")
+        first, second = analyze_complexity(task), analyze_complexity(task)
+        assert first.overall == second.overall
+        assert first.dimensions == second.dimensions
+
+    def test_results_are_independent(self):
+        """Mutating one result does not leak into later cached results."""
+        task = Task("Implement merge sort", type="coding")
+        first = analyze_complexity(task)
+        first.dimensions['algorithmic'] = -1.0
+        assert analyze_complexity(task).dimensions['algorithmic'] != -1.0
+
+    def test_cache_distinguishes_examples(self):
+        """Tasks differing only in examples/constraints are not conflated."""
+        bare = Task("Implement merge sort")
+        with_examples = Task("Implement merge sort", examples=[{"in": "[2,1]"}])
+        assert (analyze_complexity(bare).dimensions['ambiguity']
+                != analyze_complexity(with_examples).dimensions['ambiguity'])
+
+
+class TestBatch:
+    """Tests for batch complexity analysis."""
+
+    def test_batch_matches_single(self):
+        """Batch analysis equals analyzing each task on its own."""
+        tasks = [
+            Task("Optimize the query", type="data"),
+            Task("Write a poem"),
+            Task("Optimize the query", type="data"),
+            Task("sort 20000 rows", constraints=["stable"]),
+        ]
+        batch = analyze_complexity_batch(tasks)
+        assert [a.overall for a in batch] == [analyze_complexity(t).overall for t in tasks]
+        assert batch[0] is not batch[2]
+
+    def test_empty_batch(self):
+        """An empty batch gives an empty result."""
+        assert analyze_complexity_batch([]) == []
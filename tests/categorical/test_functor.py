@@ -297,6 +297,40 @@ class TestFunctorImplementation:
                 "High complexity should use Autonomous Evolution"
 
 
+
+class TestBatchMapping:
+    """Tests for batched object mapping."""
+
+    @pytest.fixture
+    def functor(self) -> Functor:
+        """Create functor for testing."""
+        return create_task_to_prompt_functor(llm_client=None)
+
+    def test_map_objects_matches_map_object(self, functor: Functor):
+        """Batch mapping equals mapping each task on its own."""
+        tasks = [
+            Task("Implement binary search", type="coding"),
+            Task("Design a distributed cache system", constraints=["low latency"]),
+            Task("Implement binary search", type="coding"),
+            Task("Write a poem"),
+        ]
+        batch = functor.map_objects(tasks)
+        single = [functor.map_object(task) for task in tasks]
+
+        assert [p.template for p in batch] == [p.template for p in single]
+        assert [p.context for p in batch] == [p.context for p in single]
+        assert [p.variables for p in batch] == [p.variables for p in single]
+        assert batch[0] is not batch[2]
+
+    def test_map_objects_without_batch_function(self):
+        """Functors without map_object_batch map one task at a time."""
+        functor = Functor(map_object=len, map_morphism=lambda f: f)
+        assert functor.map_objects(["a", "abc"]) == [1, 3]
+
+    def test_empty_batch(self, functor: Functor):
+        """An empty batch gives an empty result."""
+        assert functor.map_objects([]) == []
+
 # Run tests with pytest
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
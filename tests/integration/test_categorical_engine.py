@@ -10,10 +10,17 @@ Tests complete categorical workflows:
 Uses mock LLM for deterministic testing.
 """
 
+import asyncio
+import copy
+import sys
+import threading
+import types
+
 import pytest
 from typing import List
 from datetime import datetime
 
+from meta_prompting_engine.categorical import engine as engine_module
 from meta_prompting_engine.categorical.types import Task, QualityScore
 from meta_prompting_engine.categorical.engine import (
     CategoricalMetaPromptingEngine,
@@ -21,6 +28,7 @@ from meta_prompting_engine.categorical.engine import (
     CategoricalExecutionResult,
     create_categorical_engine
 )
+from meta_prompting_engine.categorical.monad import Monad, MonadPrompt
 from meta_prompting_engine.monitoring.enriched_quality import QualityMonitor
 
 
@@ -177,6 +185,7 @@ class TestCategoricalEngineIntegration:
         # Verify metadata
         assert result.timestamp is not None
         assert isinstance(result.timestamp, datetime)
+        assert result.metadata['timestamp'] == result.timestamp.isoformat()
         assert 'execution_id' in result.metadata
         assert 'config' in result.metadata
 
@@ -206,6 +215,63 @@ class TestCategoricalEngineIntegration:
         reset_stats = engine.get_statistics()
         assert reset_stats['execution_count'] == 0
 
+    def test_refinement_prompt_extends_previous_prompt(
+        self,
+        engine: CategoricalMetaPromptingEngine,
+        mock_llm: MockLLMClient
+    ):
+        """Refinement prompts keep the executed prompt as a cacheable prefix."""
+        engine.execute(Task(description="Prefix task"), max_iterations=2, quality_threshold=1.0)
+
+        executed, refined = mock_llm.call_history[0], mock_llm.call_history[1]
+        assert refined.startswith(executed)
+        assert "Previous output:" in refined[len(executed):]
+
+    def test_no_redundant_llm_calls(self, mock_llm: MockLLMClient):
+        """Outputs the monad already produced are not requested again."""
+        engine = create_categorical_engine(llm_client=mock_llm, max_iterations=2)
+
+        result = engine.execute(Task(description="Counted task"), quality_threshold=1.0)
+
+        # unit(initial), then unit(refined) and join for the one refinement
+        assert mock_llm.call_count == 3
+        assert result.output == result.prompts_history[-1].output
+
+    def test_verify_sample_rate(self, mock_llm: MockLLMClient):
+        """Only one in verify_sample_rate executions runs the law checks."""
+        engine = create_categorical_engine(
+            llm_client=mock_llm, max_iterations=1, verify_sample_rate=3
+        )
+
+        results = [
+            engine.execute(Task(description=f"Sampled {i}"), verify_laws=True)
+            for i in range(4)
+        ]
+
+        assert [r.functor_laws_verified for r in results] == [True, False, False, True]
+        assert [r.monad_laws_verified for r in results] == [True, False, False, True]
+
+    def test_verify_sample_rate_counts_only_requests(self, mock_llm: MockLLMClient):
+        """Executions that do not request verification do not advance the sampling."""
+        engine = create_categorical_engine(
+            llm_client=mock_llm, max_iterations=1, verify_sample_rate=2
+        )
+
+        results = [
+            engine.execute(Task(description=f"Interleaved {i}"), verify_laws=i % 2 == 1)
+            for i in range(8)
+        ]
+
+        requested = results[1::2]
+        assert [r.functor_laws_verified for r in requested] == [True, False, True, False]
+        assert not any(r.functor_laws_verified for r in results[0::2])
+
+    @pytest.mark.parametrize("rate", [0, -1])
+    def test_verify_sample_rate_rejects_non_positive(self, rate: int):
+        """A sample rate below 1 is rejected when the config is built."""
+        with pytest.raises(ValueError, match="verify_sample_rate"):
+            CategoricalMetaPromptingConfig(verify_sample_rate=rate)
+
     def test_factory_function(self, mock_llm: MockLLMClient):
         """Test create_categorical_engine factory function."""
         engine = create_categorical_engine(
@@ -400,6 +466,294 @@ class TestEndToEndScenarios:
             assert result.final_quality >= result.initial_quality - 0.1  # Allow small variance
 
 
+class RendezvousLLMClient(MockLLMClient):
+    """Mock LLM client whose first calls block until `parties` are in flight."""
+
+    def __init__(self, parties: int):
+        super().__init__()
+        self.barrier = threading.Barrier(parties)
+        self.met = False
+
+    def complete(self, prompt: str) -> str:
+        if not self.met:
+            # Raises BrokenBarrierError if the calls never overlap
+            self.barrier.wait(timeout=5)
+            self.met = True
+        return super().complete(prompt)
+
+
+class TestConcurrentExecution:
+    """Tests for execute_async and execute_batch."""
+
+    def test_execute_async_matches_execute(self):
+        """execute_async returns a regular result."""
+        engine = create_categorical_engine(llm_client=MockLLMClient(), max_iterations=2)
+
+        result = asyncio.run(engine.execute_async(Task(description="Async task")))
+
+        assert isinstance(result, CategoricalExecutionResult)
+        assert result.metadata['execution_id'] == 1
+
+    def test_batch_overlaps_latency(self):
+        """Independent tasks have their LLM calls in flight at the same time."""
+        tasks = [Task(description=f"Task {i}") for i in range(4)]
+        llm = RendezvousLLMClient(parties=len(tasks))
+        engine = create_categorical_engine(llm_client=llm, max_iterations=1)
+
+        results = asyncio.run(engine.execute_batch(tasks, max_concurrency=4))
+
+        assert [r.task for r in results] == tasks
+        assert engine.get_statistics()['execution_count'] == len(tasks)
+        assert sorted(r.metadata['execution_id'] for r in results) == [1, 2, 3, 4]
+
+    def test_batch_returns_exceptions_in_place(self):
+        """A failing task does not cancel the rest of the batch."""
+        class FailingLLMClient(MockLLMClient):
+            def complete(self, prompt: str) -> str:
+                if "Broken" in prompt:
+                    raise RuntimeError("provider error")
+                return super().complete(prompt)
+
+        engine = create_categorical_engine(llm_client=FailingLLMClient(), max_iterations=1)
+        tasks = [Task(description="Fine task"), Task(description="Broken task")]
+
+        results = asyncio.run(engine.execute_batch(tasks))
+
+        assert isinstance(results[0], CategoricalExecutionResult)
+        assert isinstance(results[1], RuntimeError)
+
+
+class TestResultCache:
+    """Tests for the optional execution result cache."""
+
+    @staticmethod
+    def make_engine(llm: MockLLMClient, **kwargs) -> CategoricalMetaPromptingEngine:
+        return create_categorical_engine(
+            llm_client=llm, max_iterations=2, enable_result_cache=True, **kwargs
+        )
+
+    def test_repeated_task_skips_llm(self):
+        """A repeated identical task is answered from the cache."""
+        llm = MockLLMClient()
+        engine = self.make_engine(llm)
+
+        first = engine.execute(Task(description="Cached task"))
+        calls = llm.call_count
+        second = engine.execute(Task(description="Cached task"))
+
+        assert llm.call_count == calls
+        assert second.output == first.output
+        assert second.metadata['cache_hit']
+        assert 'cache_hit' not in first.metadata
+        assert engine.get_statistics()['result_cache_hits'] == 1
+
+    def test_key_covers_task_fields_and_overrides(self):
+        """Tasks or overrides that differ are executed again."""
+        llm = MockLLMClient()
+        engine = self.make_engine(llm)
+
+        engine.execute(Task(description="Keyed task"))
+        engine.execute(Task(description="Keyed task", constraints=["fast"]))
+        engine.execute(Task(description="Keyed task"), quality_threshold=0.5)
+
+        assert engine.get_statistics()['result_cache_hits'] == 0
+        assert engine.get_statistics()['result_cache_size'] == 3
+
+    def test_cache_is_bounded_lru(self):
+        """The least recently used result is evicted first."""
+        engine = self.make_engine(MockLLMClient(), result_cache_size=2)
+
+        engine.execute(Task(description="a"))
+        engine.execute(Task(description="b"))
+        engine.execute(Task(description="a"))
+        engine.execute(Task(description="c"))
+        engine.execute(Task(description="a"))
+        engine.execute(Task(description="b"))
+
+        assert engine.get_statistics()['result_cache_hits'] == 2
+        assert engine.get_statistics()['result_cache_size'] == 2
+
+    def test_disabled_by_default(self):
+        """Without the flag every execution calls the LLM."""
+        llm = MockLLMClient()
+        engine = create_categorical_engine(llm_client=llm, max_iterations=1)
+
+        engine.execute(Task(description="Uncached"))
+        calls = llm.call_count
+        engine.execute(Task(description="Uncached"))
+
+        assert llm.call_count == 2 * calls
+        assert engine.get_statistics()['result_cache_size'] == 0
+
+
+class TestPromptCache:
+    """Tests for the optional prompt-level completion cache."""
+
+    def test_identical_prompts_reach_llm_once(self):
+        """Repeated prompt text, even from another execution, is not resent."""
+        llm = MockLLMClient()
+        engine = create_categorical_engine(
+            llm_client=llm, max_iterations=1, enable_prompt_cache=True
+        )
+
+        engine.execute(Task(description="Shared prompt"))
+        calls = llm.call_count
+        engine.execute(Task(description="Shared prompt"))
+
+        stats = engine.get_statistics()
+        assert llm.call_count == calls
+        assert stats['prompt_cache_hits'] == calls
+        assert stats['prompt_cache_misses'] == calls
+
+    def test_caching_client_copies(self):
+        """The caching wrapper can be copied before or after use."""
+        wrapper = engine_module._CachingLLMClient(MockLLMClient(), maxsize=4)
+        wrapper.complete("prompt")
+
+        clone = copy.copy(wrapper)
+
+        assert clone.client is wrapper.client
+        assert clone.hits == 0 and clone.misses == 1
+        assert clone.call_count == 1  # Delegated to the wrapped client
+
+    def test_stats_ignore_client_counters(self):
+        """Without the prompt cache, a client's own hits/misses are not reported."""
+        llm = MockLLMClient()
+        llm.hits, llm.misses = 7, 3
+        engine = create_categorical_engine(llm_client=llm, max_iterations=1)
+
+        stats = engine.get_statistics()
+        assert stats['prompt_cache_hits'] == 0
+        assert stats['prompt_cache_misses'] == 0
+
+    def test_bounded(self):
+        """The cache keeps at most prompt_cache_size completions."""
+        llm = MockLLMClient()
+        engine = create_categorical_engine(
+            llm_client=llm, max_iterations=1,
+            enable_prompt_cache=True, prompt_cache_size=1
+        )
+
+        engine.execute(Task(description="first"))
+        engine.execute(Task(description="second"))
+        engine.execute(Task(description="first"))
+
+        assert llm.call_count == 3
+        assert engine.llm_client.call_count == 3  # other attributes pass through
+
+
+class FakeMetric:
+    """Stand-in for prometheus_client Counter/Histogram."""
+
+    def __init__(self, name, documentation, buckets=None):
+        self.name = name
+        self.values: List[float] = []
+
+    def inc(self, amount: float = 1):
+        self.values.append(amount)
+
+    def observe(self, value: float):
+        self.values.append(value)
+
+
+class TestPrometheusMetrics:
+    """Tests for export_prometheus_metrics."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_metrics(self, monkeypatch):
+        monkeypatch.setattr(engine_module, '_prometheus_metrics', None)
+
+    def test_metrics_shared_across_engines(self, monkeypatch):
+        """Executions of every engine feed one set of metrics."""
+        fake = types.ModuleType('prometheus_client')
+        fake.Counter = fake.Histogram = FakeMetric
+        monkeypatch.setitem(sys.modules, 'prometheus_client', fake)
+
+        engines = [
+            create_categorical_engine(
+                llm_client=MockLLMClient(), max_iterations=1,
+                export_prometheus_metrics=True
+            )
+            for _ in range(2)
+        ]
+        for engine in engines:
+            engine.execute(Task(description="Metered"))
+
+        metrics = engines[0]._prometheus_metrics
+        assert metrics is engines[1]._prometheus_metrics
+        assert metrics['executions'].values == [1, 1]
+        assert len(metrics['latency'].values) == 2
+
+    def test_missing_prometheus_client(self, monkeypatch):
+        """Without prometheus_client the engine runs without metrics."""
+        monkeypatch.setitem(sys.modules, 'prometheus_client', None)
+
+        engine = create_categorical_engine(
+            llm_client=MockLLMClient(), max_iterations=1,
+            export_prometheus_metrics=True
+        )
+
+        assert engine._prometheus_metrics is None
+        assert engine.execute(Task(description="Unmetered")).output
+
+
+class TestPlateauStopping:
+    """Tests for stopping when quality improvement plateaus."""
+
+    @staticmethod
+    def make_engine(qualities: List[float], **kwargs) -> CategoricalMetaPromptingEngine:
+        """Engine whose monad reports the given quality after each iteration."""
+        engine = create_categorical_engine(llm_client=MockLLMClient(), **kwargs)
+        scripted = iter(qualities)
+        engine.monad = Monad(
+            unit=lambda p: MonadPrompt(p, QualityScore(0.5)),
+            join=lambda nested: MonadPrompt(
+                nested.prompt, QualityScore(next(scripted)), nested.meta_level
+            )
+        )
+        return engine
+
+    def test_stops_on_plateau(self):
+        """A sub-min_quality_improvement step after the first refinement stops the loop."""
+        engine = self.make_engine(
+            [0.6, 0.62, 0.64, 0.66, 0.68], max_iterations=6, plateau_patience=1
+        )
+
+        result = engine.execute(Task(description="Plateau"), quality_threshold=1.0)
+
+        assert [p.quality.value for p in result.prompts_history] == [0.5, 0.6, 0.62]
+
+    def test_off_by_default(self):
+        """Without plateau_patience, small steps do not stop the loop."""
+        engine = self.make_engine([0.6, 0.62, 0.64, 0.66, 0.68], max_iterations=6)
+
+        result = engine.execute(Task(description="Plateau"), quality_threshold=1.0)
+
+        assert result.iterations == 6
+
+    def test_patience(self):
+        """plateau_patience consecutive small steps are required."""
+        engine = self.make_engine(
+            [0.6, 0.62, 0.7, 0.71, 0.72, 0.73, 0.74], max_iterations=8, plateau_patience=2
+        )
+
+        result = engine.execute(Task(description="Plateau"), quality_threshold=1.0)
+
+        # 0.62 alone is tolerated; 0.71 then 0.72 stops the loop
+        assert result.final_quality == 0.72
+
+    def test_disabled_without_early_stopping(self):
+        """early_stopping=False always runs max_iterations."""
+        engine = self.make_engine(
+            [0.6, 0.6, 0.6, 0.6, 0.6], max_iterations=6,
+            plateau_patience=1, early_stopping=False
+        )
+
+        result = engine.execute(Task(description="Plateau"), quality_threshold=1.0)
+
+        assert result.iterations == 6
+
+
 # Run tests
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -11,21 +11,30 @@ Tests verify:
 Reference: arXiv:2410.21889 (Contextads as Wreaths)
 """
 
+import copy
+import pickle
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from datetime import datetime
+
 import pytest
 
+from meta_prompting_engine.categorical import contextad as contextad_module
 from meta_prompting_engine.categorical.contextad import (
     Contextad,
     ContextadObservation,
     ExternalContext,
     Tool,
     KnowledgeBase,
+    chunk_id,
     create_contextad,
     create_contextad_with_tools,
     create_mcp_tool,
     summarize_action,
     enhance_with_knowledge_action,
 )
-from meta_prompting_engine.categorical.graded_comonad import Tier
+from meta_prompting_engine.categorical.graded_comonad import GradedComonad, Tier
 
 
 class TestTool:
@@ -58,6 +67,83 @@ class TestTool:
         assert "echo" in result.lower()
         assert "hello" in result
 
+    def test_coalesced_tool_runs_once_for_concurrent_calls(self, monkeypatch):
+        """Concurrent identical calls to a coalescing tool share one run."""
+        started = threading.Event()
+        release = threading.Event()
+        waiting = threading.Barrier(4)  # the three followers and this thread
+        runs = []
+
+        class FollowerFuture(Future):
+            def result(self, timeout=None):
+                waiting.wait(timeout=5)
+                return super().result(timeout)
+
+        monkeypatch.setattr(contextad_module, "Future", FollowerFuture)
+
+        def slow_lookup(kwargs):
+            runs.append(kwargs)
+            started.set()
+            release.wait(timeout=5)
+            return kwargs["q"].upper()
+
+        tool = Tool("lookup", "Slow lookup", execute=slow_lookup, coalesce=True)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            first = pool.submit(tool, q="x")
+            started.wait(timeout=5)
+            rest = [pool.submit(tool, q="x") for _ in range(3)]
+            waiting.wait(timeout=5)  # all followers hold the in-flight call
+            release.set()
+            results = [first.result()] + [f.result() for f in rest]
+
+        assert results == ["X"] * 4
+        assert len(runs) == 1
+        # Once finished, a new call runs again; unhashable args are not coalesced
+        assert tool(q="x") == "X"
+        assert tool(q="y", tags=["a"]) == "Y"
+        assert len(runs) == 3
+
+    def test_coalesced_tool_reentrant_call_runs_directly(self):
+        """A coalescing tool calling itself with the same arguments does not deadlock."""
+        depth = []
+
+        def recursive(kwargs):
+            depth.append(kwargs["n"])
+            if len(depth) < 3:
+                return tool(n=kwargs["n"]) + 1
+            return 0
+
+        tool = Tool("recurse", "Calls itself", execute=recursive, coalesce=True)
+
+        assert tool(n=1) == 2
+        assert depth == [1, 1, 1]
+        assert contextad_module._inflight_calls == {}
+
+    def test_coalesced_tool_reentrant_call_from_handed_off_thread(self):
+        """Re-entry from a thread running in the leading call's context does not deadlock."""
+        runs = []
+
+        def delegating(kwargs):
+            runs.append(kwargs["q"])
+            if len(runs) == 1:
+                with ThreadPoolExecutor(max_workers=1) as pool:
+                    ctx = copy_context()
+                    return pool.submit(ctx.run, lambda: tool(q=kwargs["q"])).result(timeout=5)
+            return kwargs["q"].upper()
+
+        tool = Tool("delegate", "Hands work to a thread", execute=delegating, coalesce=True)
+
+        assert tool(q="x") == "X"
+        assert runs == ["x", "x"]
+
+    def test_tool_copy_and_pickle(self):
+        """Coalescing state is not part of the Tool, so it copies and pickles."""
+        tool = Tool("count", "Counts arguments", execute=len, coalesce=True)
+
+        for clone in (copy.deepcopy(tool), pickle.loads(pickle.dumps(tool))):
+            assert clone == tool
+            assert clone(a=1, b=2) == 2
+
 
 class TestKnowledgeBase:
     """Tests for KnowledgeBase class."""
@@ -95,6 +181,38 @@ class TestKnowledgeBase:
         results = kb.retrieve("any query")
         assert results == ["hello", "world"]
 
+    def test_retrieve_cached_by_query_words(self):
+        """Queries with the same words share a cached result."""
+        kb = KnowledgeBase("kb", documents=["Python data", "Rust safety"])
+        first = kb.retrieve("python data", k=1)
+        assert kb.retrieve("Data PYTHON", k=1) == first
+        assert len(kb._retrieve_cache) == 1
+        # Callers get their own copy
+        first.append("extra")
+        assert kb.retrieve("python data", k=1) == ["Python data"]
+
+    def test_retrieve_cache_tracks_documents(self):
+        """Changing documents invalidates cached results."""
+        kb = KnowledgeBase("kb", documents=["Rust safety"])
+        assert kb.retrieve("python", k=1) == ["Rust safety"]
+        kb.documents.append("python tips")
+        assert kb.retrieve("python", k=1) == ["python tips"]
+        kb.documents[1] = "more python tips"
+        assert kb.retrieve("python", k=1) == ["more python tips"]
+
+    def test_retrieve_by_words(self):
+        """Pre-tokenized retrieval matches retrieve."""
+        kb = KnowledgeBase("kb", documents=["Python data", "Rust safety"])
+        assert kb.retrieve_by_words(frozenset({"rust"}), k=1) == kb.retrieve("Rust", k=1)
+
+    def test_add_document(self):
+        """Added documents are retrievable without re-indexing."""
+        kb = KnowledgeBase("kb", documents=["Rust safety"])
+        kb.retrieve("rust")
+        kb.add_document("Python tips")
+        assert kb.documents == ["Rust safety", "Python tips"]
+        assert kb.retrieve("python", k=1) == ["Python tips"]
+
 
 class TestExternalContext:
     """Tests for ExternalContext class."""
@@ -128,6 +246,17 @@ class TestExternalContext:
         assert len(context.knowledge) == 1
         assert "kb1" in context.knowledge
 
+    def test_with_added_tools(self, context):
+        """Should add tools to a copy, leaving the original untouched."""
+        extended = context.with_added_tools([Tool("tool3", "Third tool")])
+        assert set(extended.tools) == {"tool1", "tool2", "tool3"}
+        assert set(context.tools) == {"tool1", "tool2"}
+
+        extended.add_knowledge(KnowledgeBase("kb2", documents=["other"]))
+        extended.metadata["source"] = "extended"
+        assert set(context.knowledge) == {"kb1"}
+        assert "source" not in context.metadata
+
     def test_retrieve_from_specific_kb(self, context):
         """Should retrieve from specific KB."""
         results = context.retrieve_knowledge("doc", kb_name="kb1")
@@ -170,6 +299,17 @@ class TestContextadObservation:
         assert "L5" in s
         assert "hello" in s
 
+    def test_observation_timestamp(self):
+        """Should expose creation time as a datetime, or keep a given one."""
+        before = datetime.now()
+        obs = ContextadObservation(value="hello", grade=Tier.L5)
+        assert abs((obs.timestamp - before).total_seconds()) < 1
+
+        given = datetime(2024, 1, 1, 12, 0)
+        older = ContextadObservation(value="hello", grade=Tier.L5, timestamp=given)
+        assert older.timestamp is given
+        assert older.timestamp_ns < obs.timestamp_ns
+
 
 class TestContextadComonadicOperations:
     """Tests for comonadic operations."""
@@ -195,6 +335,17 @@ class TestContextadComonadicOperations:
         # L1 has 1200 tokens ≈ 4800 chars
         assert len(extracted) <= 4800
 
+    def test_extract_uses_custom_graded_comonad(self, observation):
+        """Extract should defer to an overridden graded extract."""
+        class Tagging(GradedComonad):
+            def extract(self, wa):
+                return ("tagged", wa.current, wa.grade)
+
+        contextad = Contextad(graded_comonad=Tagging())
+        assert contextad.extract(observation) == (
+            "tagged", observation.value, observation.grade
+        )
+
     def test_duplicate(self, contextad, observation):
         """Duplicate should create meta-observation."""
         dup = contextad.duplicate(observation)
@@ -262,6 +413,38 @@ class TestContextadActegoryOperations:
         assert acted.value == "RAW TEXT"
         assert "uppercase" in acted.actions_applied
 
+    def test_act_copies_action_log(self, contextad, obs_with_tools):
+        """Act should extend a copy of the log, leaving the original untouched."""
+        first = contextad.act(obs_with_tools, lambda ext, val: val, "a1")
+        left = contextad.act(first, lambda ext, val: val, "a2")
+        right = contextad.act(first, lambda ext, val: val, "b2")
+
+        assert first.actions_applied == ["a1"]
+        assert left.actions_applied == ["a1", "a2"]
+        assert right.actions_applied == ["a1", "b2"]
+        assert left.actions_applied[-1] == "a2"
+
+        left.actions_applied.append("a3")
+        assert left.actions_applied == ["a1", "a2", "a3"]
+        assert first.actions_applied == ["a1"]
+
+    def test_act_many_matches_chained_act(self, contextad, obs_with_tools):
+        """act_many should equal applying each action with act."""
+        actions = [
+            (lambda ext, val: val.upper(), "upper"),
+            (lambda ext, val: val + "!", "exclaim"),
+        ]
+        chained = obs_with_tools
+        for action, name in actions:
+            chained = contextad.act(chained, action, name)
+
+        batched = contextad.act_many(obs_with_tools, actions)
+
+        assert batched.value == chained.value == "RAW TEXT!"
+        assert batched.actions_applied == chained.actions_applied
+        assert batched.metadata == chained.metadata
+        assert contextad.act_many(obs_with_tools, []) is obs_with_tools
+
     def test_act_preserves_structure(self, contextad, obs_with_tools):
         """Act should preserve observation structure."""
         def identity_action(external, value):
@@ -314,6 +497,15 @@ class TestContextadKnowledgeRetrieval:
         assert "Retrieved knowledge" in augmented.value
         assert "Python" in augmented.value
 
+    def test_retrieve_records_chunk_ids(self, contextad, obs_with_knowledge):
+        """Should record a stable id per retrieved document."""
+        augmented = contextad.retrieve_and_augment(obs_with_knowledge, query="Python")
+        ids = augmented.metadata['retrieved_chunk_ids']
+
+        assert ids[0] == chunk_id("Python is a programming language")
+        assert len(ids) == 2  # two per knowledge base by default
+        assert chunk_id("Python is a programming language") != chunk_id("Comonads extract context")
+
     def test_retrieve_with_query(self, contextad, obs_with_knowledge):
         """Should use custom query."""
         augmented = contextad.retrieve_and_augment(
@@ -394,6 +586,19 @@ class TestContextadLaws:
         assert laws['identity_action']
         assert laws['action_composition']
 
+    def test_actegory_laws_apply_identity_actions(self, observation):
+        """Identity actions are still run through act, so a broken act is caught."""
+        class SuffixingContextad(Contextad):
+            def act(self, ctx, action, action_name="unnamed_action"):
+                acted = super().act(ctx, action, action_name)
+                acted.value = f"{acted.value}!"
+                return acted
+
+        laws = SuffixingContextad().verify_actegory_laws(
+            observation, lambda ext, val: val, lambda ext, val: val
+        )
+        assert not laws['identity_action']
+
 
 class TestFactoryFunctions:
     """Tests for factory functions."""
@@ -14,6 +14,7 @@ Reference: arXiv:2501.06662 (Magnitude of Categories of Texts)
 import pytest
 import math
 
+from meta_prompting_engine.categorical import enriched_magnitude as em_module
 from meta_prompting_engine.categorical.enriched_magnitude import (
     EnrichedMagnitude,
     MagnitudeResult,
@@ -167,6 +168,31 @@ class TestIncrementalComputation:
 
         assert abs(incremental.value - full.value) < 0.01
 
+    @pytest.mark.parametrize("distance_type", ["edit", "cosine", "ngram"])
+    def test_incremental_chain_matches_full(self, distance_type):
+        """Repeated bordered updates agree with recomputing each time."""
+        mag = create_magnitude_computer(distance_type)
+        items = ["sort the list", "sort the list please", "debug the model",
+                 "write a test", "sort the list", "review the data"]
+
+        result = mag.compute(items[:1])
+        for i in range(1, len(items)):
+            result = mag.compute_incremental(result, items[i], items[:i])
+
+        full = mag.compute(items)
+        assert result.value == pytest.approx(full.value)
+        assert result.weights == pytest.approx(full.weights)
+        assert result.redundancy_pairs == full.redundancy_pairs
+
+    def test_incremental_without_factor_recomputes(self, mag):
+        """Results without a cached factor fall back to a full compute."""
+        items = ["a", "b", "c"]
+        initial = mag.compute(items)
+        initial._cholesky = None
+
+        updated = mag.compute_incremental(initial, "d", items)
+        assert updated.value == pytest.approx(mag.compute(items + ["d"]).value)
+
 
 class TestDiversityContribution:
     """Tests for diversity contribution measurement."""
@@ -224,6 +250,54 @@ class TestDiverseSubsetSelection:
         first_chars = set(s[0] for s in selected)
         assert len(first_chars) >= 2
 
+    @pytest.mark.parametrize("distance_type", ["edit", "cosine", "ngram"])
+    def test_matches_naive_greedy(self, distance_type):
+        """Each step picks the item with the largest diversity contribution."""
+        mag = create_magnitude_computer(distance_type)
+        items = ["sort the list", "sort a list", "debug the model", "write a test",
+                 "review the data", "debug this model", "parse the query"]
+
+        expected = []
+        remaining = list(items)
+        for _ in range(4):
+            best = max(remaining, key=lambda item: mag.diversity_contribution(item, expected))
+            expected.append(best)
+            remaining.remove(best)
+
+        selected, result = mag.select_diverse_subset(items, 4)
+        assert selected == expected
+        assert result.value == pytest.approx(mag.compute(expected).value)
+
+    def test_empty_string_can_be_selected(self, mag):
+        """An empty item still counts towards k."""
+        selected, _ = mag.select_diverse_subset(["abc", "", "abd"], 2)
+        assert selected == ["abc", ""]
+
+
+class TestLinearSolve:
+    """Tests for solving Z·w = 1."""
+
+    @pytest.fixture
+    def mag(self):
+        return EnrichedMagnitude()
+
+    def test_solution_satisfies_system(self, mag):
+        """Cholesky and elimination both return w with Z·w = 1."""
+        items = ["sort the list", "debug the model", "write a test", "review data"]
+        Z = mag._compute_similarity_matrix(items)
+        factor = mag._cholesky_factor(Z)
+        assert factor is not None
+
+        for w in (mag._cholesky_solve(factor), mag._solve_linear_system(Z)):
+            for row in Z:
+                assert sum(z * x for z, x in zip(row, w)) == pytest.approx(1.0)
+
+    def test_falls_back_when_not_positive_definite(self, mag):
+        """Indefinite Z is solved by elimination instead."""
+        Z = [[1.0, 2.0], [2.0, 1.0]]
+        assert mag._cholesky_factor(Z) is None
+        assert mag._solve_linear_system(Z) == pytest.approx([1 / 3, 1 / 3])
+
 
 class TestDistanceFunctions:
     """Tests for different distance functions."""
@@ -248,6 +322,60 @@ class TestDistanceFunctions:
         d = ngram_distance("hello", "world")
         assert d > 0
 
+    @pytest.mark.parametrize("distance_type", ["edit", "cosine", "ngram"])
+    def test_similarity_matrix_matches_pairwise(self, distance_type):
+        """Precomputed per-item sets give exp(-scale * d) of pairwise calls."""
+        mag = create_magnitude_computer(distance_type, scale=2.0)
+        items = ["Write the code", "write code now", "", "Test the code"]
+        Z = mag._compute_similarity_matrix(items)
+        for i, a in enumerate(items):
+            for j, b in enumerate(items):
+                expected = math.exp(-2.0 * mag.distance_fn(a, b)) if i != j else 1.0
+                assert Z[i][j] == expected
+
+    def test_levenshtein(self):
+        """Pure-Python edit distance."""
+        assert EnrichedMagnitude._levenshtein("kitten", "sitting") == 3
+        assert EnrichedMagnitude._levenshtein("", "abc") == 3
+
+    @pytest.mark.parametrize("a,b", [
+        ("", ""), ("abc", ""), ("flaw", "lawn"), ("aaaa", "aa"),
+        ("café au lait", "cafe ole"), ("ab" * 50, "ba" * 40),
+    ])
+    def test_levenshtein_matches_dp(self, a, b, monkeypatch):
+        """Bit-parallel distance agrees with the textbook DP."""
+        monkeypatch.setattr(em_module, "_rf_levenshtein", None)
+        row = list(range(len(b) + 1))
+        for i, c1 in enumerate(a):
+            prev, row = row, [i + 1]
+            for j, c2 in enumerate(b):
+                row.append(min(prev[j + 1] + 1, row[j] + 1, prev[j] + (c1 != c2)))
+        assert EnrichedMagnitude._levenshtein(a, b) == row[-1]
+
+    def test_levenshtein_caches_unordered_pairs(self, monkeypatch):
+        """Both argument orders share one cache entry."""
+        monkeypatch.setattr(em_module, "_rf_levenshtein", None)
+        em_module._levenshtein_py.cache_clear()
+        assert EnrichedMagnitude._levenshtein("abcd", "abce") == 1
+        assert EnrichedMagnitude._levenshtein("abce", "abcd") == 1
+        assert EnrichedMagnitude._levenshtein("ab", "xyzab") == 3
+        assert EnrichedMagnitude._levenshtein("xyzab", "ab") == 3
+        assert em_module._levenshtein_py.cache_info().currsize == 2
+
+    def test_levenshtein_uses_rapidfuzz(self, monkeypatch):
+        """Edit distance delegates to rapidfuzz when it is installed."""
+        calls = []
+
+        class FakeLevenshtein:
+            @staticmethod
+            def distance(a, b):
+                calls.append((a, b))
+                return 7
+
+        monkeypatch.setattr(em_module, "_rf_levenshtein", FakeLevenshtein)
+        assert EnrichedMagnitude._levenshtein("kitten", "sitting") == 7
+        assert calls == [("kitten", "sitting")]
+
     def test_create_magnitude_with_cosine(self):
         """Should create magnitude computer with cosine distance."""
         mag = create_magnitude_computer("cosine")